@@ -1,5 +1,7 @@
 """Configuration management for JIRA Roadmap."""
 
+import threading
+import time
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,29 +19,57 @@ class Config:
     jira_api_token: str
     start_date_field: str | None = None
     end_date_field: str | None = None
+    max_workers: int | None = None  # concurrent JIRA requests; library default if unset
 
-    def validate(self) -> list[str]:
-        """Validate configuration values. Returns list of error messages."""
+    def validate(self) -> tuple[str, ...]:
+        """Validate configuration values. Returns tuple of error messages."""
         errors: list[str] = []
 
-        if not self.jira_url:
+        url = self.jira_url
+        if not url:
             errors.append("JIRA URL is required")
         else:
-            parsed = urlparse(self.jira_url)
+            parsed = urlparse(url)
             if parsed.scheme not in ("http", "https"):
                 errors.append("JIRA URL must start with http:// or https://")
             if not parsed.netloc:
                 errors.append("JIRA URL must include a domain")
 
-        if not self.jira_email:
+        email = self.jira_email
+        if not email:
             errors.append("JIRA email is required")
-        elif "@" not in self.jira_email:
+        elif email.find("@") < 1:
             errors.append("JIRA email must be a valid email address")
 
         if not self.jira_api_token:
             errors.append("JIRA API token is required")
 
-        return errors
+        if self.max_workers is not None and (
+            not isinstance(self.max_workers, int)
+            or isinstance(self.max_workers, bool)
+            or self.max_workers < 1
+        ):
+            errors.append("JIRA max_workers must be a positive integer")
+
+        return tuple(errors)
+
+
+# Parsed configs keyed by path, invalidated when the file's mtime or size changes.
+_CONFIG_CACHE: dict[Path, tuple[int, int, Config]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# How long a successful config_exists() check is trusted before stat-ing again.
+CONFIG_EXISTS_TTL_SECONDS = 5.0
+
+# Config paths seen to exist, mapped to the monotonic time the check expires.
+_CONFIG_EXISTS_CACHE: dict[Path, float] = {}
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configurations so the next load re-reads the file."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+        _CONFIG_EXISTS_CACHE.clear()
 
 
 def get_config_dir() -> Path:
@@ -53,13 +83,28 @@ def get_config_path() -> Path:
 
 
 def config_exists() -> bool:
-    """Check if configuration file exists."""
-    return get_config_path().exists()
+    """Check if configuration file exists.
+
+    A positive answer is reused for ``CONFIG_EXISTS_TTL_SECONDS``; a missing
+    file is checked every time so a newly created config is picked up at once.
+    """
+    config_path = get_config_path()
+    now = time.monotonic()
+    with _CONFIG_CACHE_LOCK:
+        if _CONFIG_EXISTS_CACHE.get(config_path, 0.0) > now:
+            return True
+    if not config_path.exists():
+        return False
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_EXISTS_CACHE[config_path] = now + CONFIG_EXISTS_TTL_SECONDS
+    return True
 
 
 def load_config() -> Config:
     """Load configuration from TOML file.
 
+    The parsed config is cached and reused until the file's mtime or size changes.
+
     Raises:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config is invalid
@@ -72,8 +117,13 @@ def load_config() -> Config:
             "Create ~/.jira-roadmap/config.toml to set up."
         )
 
-    with open(config_path, "rb") as f:
-        data = tomllib.load(f)
+    st = config_path.stat()
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(config_path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    data = tomllib.loads(config_path.read_text(encoding="utf-8"))
 
     jira_section = data.get("jira", {})
     roadmap_section = data.get("roadmap", {})
@@ -82,6 +132,7 @@ def load_config() -> Config:
         jira_url=jira_section.get("url", ""),
         jira_email=jira_section.get("email", ""),
         jira_api_token=jira_section.get("api_token", ""),
+        max_workers=jira_section.get("max_workers"),
         start_date_field=roadmap_section.get("start_date_field"),
         end_date_field=roadmap_section.get("end_date_field"),
     )
@@ -90,6 +141,9 @@ def load_config() -> Config:
     if errors:
         raise ValueError(f"Invalid configuration: {'; '.join(errors)}")
 
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[config_path] = (st.st_mtime_ns, st.st_size, config)
+
     return config
 
 
@@ -107,6 +161,8 @@ def save_config(config: Config) -> None:
             "api_token": config.jira_api_token,
         },
     }
+    if config.max_workers is not None:
+        data["jira"]["max_workers"] = config.max_workers
 
     if config.start_date_field or config.end_date_field:
         roadmap_data: dict[str, str] = {}
@@ -116,5 +172,6 @@ def save_config(config: Config) -> None:
             roadmap_data["end_date_field"] = config.end_date_field
         data["roadmap"] = roadmap_data
 
-    with open(config_path, "wb") as f:
-        tomli_w.dump(data, f)
+    config_path.write_text(tomli_w.dumps(data), encoding="utf-8")
+
+    clear_config_cache()
@@ -34,7 +34,10 @@ class JiraConnectionError(RoadmapError):
 class JiraRateLimitError(RoadmapError):
     """JIRA rate limit exceeded."""
 
-    pass
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Store how many seconds JIRA asked clients to wait, if it said."""
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class InvalidJqlError(RoadmapError):
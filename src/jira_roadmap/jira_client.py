@@ -1,7 +1,13 @@
 """JIRA API client with retry logic."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from jira import JIRA, JIRAError
+from requests.adapters import HTTPAdapter
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
@@ -9,12 +15,35 @@ from tenacity import (
 )
 
 from jira_roadmap.config import Config
+from jira_roadmap.project_cache import (
+    PROJECT_CACHE_TTL_SECONDS,
+    load_project_cache,
+    save_project_cache,
+)
+from jira_roadmap.search_cache import get_cached_search, put_cached_search, search_cache_key
+
+# Fields returned by search_roadmap_issues when the caller doesn't narrow them.
+DEFAULT_SEARCH_FIELDS = ("summary", "issuetype", "status", "issuelinks", "subtasks", "parent")
+
+# Issues requested per search page. The /search/jql endpoint pages with a
+# cursor, so larger pages mean fewer round-trips on big roadmaps.
+SEARCH_PAGE_SIZE = 500
+
+# Upper bound on concurrent requests (and pooled connections) per client,
+# unless the config sets max_workers.
+MAX_WORKERS = 8
+
+# Longest Retry-After pause honored for a single rate-limited request.
+MAX_RETRY_AFTER_SECONDS = 60
 
 
 class RateLimitError(Exception):
     """Raised when JIRA API rate limit is hit."""
 
-    pass
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Store the server's requested pause in seconds, if it sent one."""
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class AuthenticationError(Exception):
@@ -29,6 +58,27 @@ class ConnectionError(Exception):
     pass
 
 
+def _parse_retry_after(error: JIRAError) -> float | None:
+    """Read the Retry-After header (in seconds) from a rate-limited response."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER_SECONDS)
+    except (TypeError, ValueError):
+        return None
+
+
+_backoff = wait_exponential(multiplier=1, min=4, max=60)
+
+
+def _wait_for_rate_limit(retry_state: RetryCallState) -> float:
+    """Wait as long as JIRA asked via Retry-After, else back off exponentially."""
+    retry_after = getattr(retry_state.outcome.exception(), "retry_after", None)
+    if retry_after is not None:
+        return retry_after
+    return _backoff(retry_state)
+
+
 class JiraClient:
     """Client for interacting with JIRA Cloud API."""
 
@@ -36,47 +86,82 @@ class JiraClient:
         """Initialize JIRA client with configuration."""
         self.config = config
         self._client: JIRA | None = None
+        self._client_lock = threading.Lock()
+        self._max_workers = config.max_workers or MAX_WORKERS
+        # Monotonic time before which no search is sent, set when JIRA rate limits us.
+        self._resume_at = 0.0
 
     def _get_client(self) -> JIRA:
-        """Get or create JIRA client instance."""
-        if self._client is None:
-            try:
-                self._client = JIRA(
-                    server=self.config.jira_url,
-                    basic_auth=(self.config.jira_email, self.config.jira_api_token),
-                    timeout=15,
-                )
-            except JIRAError as e:
-                if e.status_code == 401:
-                    raise AuthenticationError(
-                        "Authentication failed. Check your email and API token."
-                    ) from e
-                raise
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "connection" in error_msg or "resolve" in error_msg or "timeout" in error_msg:
-                    raise ConnectionError(
-                        f"Cannot connect to JIRA server at {self.config.jira_url}. "
-                        "Check the URL and your network connection."
-                    ) from e
-                raise
-        return self._client
+        """Get or create JIRA client instance. Safe to call from multiple threads."""
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    self._client = JIRA(
+                        server=self.config.jira_url,
+                        basic_auth=(self.config.jira_email, self.config.jira_api_token),
+                        timeout=15,
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=self._max_workers, pool_maxsize=self._max_workers
+                    )
+                    self._client._session.mount("https://", adapter)
+                    self._client._session.mount("http://", adapter)
+                except JIRAError as e:
+                    if e.status_code == 401:
+                        raise AuthenticationError(
+                            "Authentication failed. Check your email and API token."
+                        ) from e
+                    raise
+                except Exception as e:
+                    error_msg = str(e).lower()
+                    if any(word in error_msg for word in ("connection", "resolve", "timeout")):
+                        raise ConnectionError(
+                            f"Cannot connect to JIRA server at {self.config.jira_url}. "
+                            "Check the URL and your network connection."
+                        ) from e
+                    raise
+            return self._client
+
+    def _pace(self) -> None:
+        """Block until any rate-limit pause requested by JIRA has passed."""
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _pause_for(self, seconds: float) -> None:
+        """Hold back searches from every thread sharing this client."""
+        with self._client_lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
 
     @retry(
         retry=retry_if_exception_type(RateLimitError),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
+        wait=_wait_for_rate_limit,
         reraise=True,
     )
-    def search_roadmap_issues(self, jql: str, date_fields: list[str] | None = None) -> list[dict]:
+    def search_roadmap_issues(
+        self,
+        jql: str,
+        date_fields: list[str] | None = None,
+        fields: list[str] | None = None,
+        batch_size: int = SEARCH_PAGE_SIZE,
+    ) -> list[dict]:
         """Search for issues relevant to roadmap visualization.
 
+        Pages through JIRA's ``/search/jql`` endpoint with its ``nextPageToken``
+        cursor, POSTing the query so long key lists don't hit URL length limits.
+        When JIRA answers 429, its ``Retry-After`` pause is applied to every
+        thread using this client before the search is retried.
+
         Args:
             jql: JQL query string
             date_fields: Custom field IDs for start/end dates
+            fields: Fields to return besides the date fields; defaults to
+                ``DEFAULT_SEARCH_FIELDS``. Fewer fields mean smaller responses.
+            batch_size: Issues requested per page; JIRA may return fewer
 
         Returns:
-            List of raw issue dicts
+            List of raw issue dicts (JIRA's JSON payload for each issue)
 
         Raises:
             RateLimitError: If rate limited (will be retried)
@@ -86,22 +171,35 @@ class JiraClient:
         client = self._get_client()
 
         try:
-            fields = ["summary", "issuetype", "status", "issuelinks", "subtasks", "parent"]
+            requested = list(fields if fields is not None else DEFAULT_SEARCH_FIELDS)
             if date_fields:
-                fields.extend(date_fields)
+                requested.extend(date_fields)
 
-            result = client.enhanced_search_issues(
-                jql,
-                maxResults=0,
-                fields=fields,
-            )
-
-            return [self._issue_to_dict(issue) for issue in result]
+            issues: list[dict] = []
+            page_token: str | None = None
+            while True:
+                self._pace()
+                page = client.enhanced_search_issues(
+                    jql,
+                    nextPageToken=page_token,
+                    maxResults=batch_size,
+                    fields=requested,
+                    json_result=True,
+                    use_post=True,
+                )
+                issues.extend(page.get("issues", []))
+                page_token = page.get("nextPageToken")
+                if not page_token:
+                    return issues
 
         except JIRAError as e:
             if e.status_code == 429:
+                retry_after = _parse_retry_after(e)
+                if retry_after:
+                    self._pause_for(retry_after)
                 raise RateLimitError(
-                    "Rate limited by JIRA. Retrying with exponential backoff..."
+                    "Rate limited by JIRA. Retrying with exponential backoff...",
+                    retry_after=retry_after,
                 ) from e
             if e.status_code == 401:
                 raise AuthenticationError(
@@ -114,20 +212,50 @@ class JiraClient:
     def get_project_names(self, project_keys: list[str]) -> dict[str, str]:
         """Fetch human-readable project names for a list of project keys.
 
+        Names are cached on disk per JIRA URL and user for
+        ``PROJECT_CACHE_TTL_SECONDS``; only missing or expired keys are fetched.
+
         Returns:
             Dict mapping project key → project name. Falls back to the key
             itself if a project cannot be fetched.
         """
-        client = self._get_client()
+        now = time.time()
+        cache = load_project_cache()
+        scope = cache.setdefault(f"{self.config.jira_url}|{self.config.jira_email}", {})
+
         result: dict[str, str] = {}
+        missing: list[str] = []
         for key in project_keys:
-            try:
-                project = client.project(key)
-                result[key] = project.name
-            except Exception:
-                result[key] = key  # graceful fallback
+            entry = scope.get(key)
+            if entry and entry[1] > now:
+                result[key] = entry[0]
+            else:
+                missing.append(key)
+
+        if not missing:
+            return result
+
+        client = self._get_client()
+        expires = now + PROJECT_CACHE_TTL_SECONDS
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(missing))) as executor:
+            names = executor.map(lambda key: self._fetch_project_name(client, key), missing)
+            for key, name in zip(missing, names):
+                if name is None:
+                    result[key] = key  # graceful fallback, not cached
+                else:
+                    result[key] = name
+                    scope[key] = [name, expires]
+        save_project_cache(cache)
         return result
 
+    @staticmethod
+    def _fetch_project_name(client: JIRA, key: str) -> str | None:
+        """Fetch a single project's name, or None if it cannot be fetched."""
+        try:
+            return client.project(key).name
+        except Exception:
+            return None
+
     def list_link_types(self) -> list[str]:
         """Get available issue link type names from JIRA.
 
@@ -135,12 +263,18 @@ class JiraClient:
             List of link type names (e.g., ["Relates", "Blocks", "Cloners"])
 
         Raises:
+            RateLimitError: If rate limited (not retried)
             AuthenticationError: If authentication fails
         """
         client = self._get_client()
         try:
             link_types = client.issue_link_types()
         except JIRAError as e:
+            if e.status_code == 429:
+                raise RateLimitError(
+                    "Rate limited by JIRA. Please wait a moment and try again.",
+                    retry_after=_parse_retry_after(e),
+                ) from e
             if e.status_code == 401:
                 raise AuthenticationError(
                     "Authentication failed. Check your email and API token."
@@ -148,9 +282,57 @@ class JiraClient:
             raise
         return [lt.name for lt in link_types]
 
-    def _issue_to_dict(self, issue) -> dict:
-        """Convert JIRA issue object to dictionary."""
-        return {
-            "key": issue.key,
-            "fields": issue.raw.get("fields", {}),
-        }
+
+class CachedJiraClient(JiraClient):
+    """JiraClient that reuses recent search results from the search cache.
+
+    Results are scoped to the JIRA URL and user, the JQL and the requested
+    date fields, and expire after ``SEARCH_CACHE_TTL_SECONDS``.
+    """
+
+    def search_roadmap_issues(
+        self,
+        jql: str,
+        date_fields: list[str] | None = None,
+        fields: list[str] | None = None,
+        batch_size: int = SEARCH_PAGE_SIZE,
+    ) -> list[dict]:
+        """Search for roadmap issues, serving repeated searches from the cache."""
+        key = search_cache_key(
+            self.config.jira_url,
+            self.config.jira_email,
+            jql,
+            ",".join(date_fields or []),
+            ",".join(fields if fields is not None else DEFAULT_SEARCH_FIELDS),
+        )
+        issues = get_cached_search(key)
+        if issues is None:
+            issues = super().search_roadmap_issues(
+                jql, date_fields=date_fields, fields=fields, batch_size=batch_size
+            )
+            put_cached_search(key, issues)
+        return issues
+
+
+# Long-lived clients by class and identity, so their pooled connections are
+# reused across roadmap fetches and web requests.
+_shared_clients: dict[tuple, JiraClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(config: Config, client_cls: type[JiraClient] = JiraClient) -> JiraClient:
+    """Return the process-wide client for this JIRA identity, creating it if needed.
+
+    A client made for an older version of the same identity (e.g. a rotated
+    API token) is dropped when its replacement is created. It isn't closed:
+    requests already running on it finish, and it is freed once unreferenced.
+    """
+    identity = (client_cls, config.jira_url, config.jira_email)
+    key = (*identity, config.jira_api_token, config.max_workers)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            for stale in [k for k in _shared_clients if k[:3] == identity]:
+                del _shared_clients[stale]
+            client = _shared_clients[key] = client_cls(config)
+        return client
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoadmapEpic:
     """An epic on the roadmap timeline."""
 
@@ -21,7 +21,7 @@ class RoadmapEpic:
     total_stories: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoadmapInitiative:
     """An initiative on the roadmap timeline, containing linked epics."""
 
@@ -35,7 +35,7 @@ class RoadmapInitiative:
     url: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoadmapResult:
     """Complete result of a roadmap fetch."""
 
@@ -0,0 +1,46 @@
+"""Persistent cache of JIRA project names."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from jira_roadmap.config import get_config_dir
+
+# Project names almost never change, so a lookup is reused for 8 hours.
+PROJECT_CACHE_TTL_SECONDS = 8 * 3600
+
+
+def get_project_cache_path() -> Path:
+    """Get the project name cache file path."""
+    return get_config_dir() / "project_names.cache.json"
+
+
+def load_project_cache() -> dict[str, dict[str, list]]:
+    """Load the project name cache.
+
+    Returns:
+        Dict mapping "url|email" scope → {project_key: [name, expiry_epoch]}.
+        An empty dict if the cache is missing or unreadable.
+    """
+    try:
+        data = json.loads(get_project_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_project_cache(cache: dict[str, dict[str, list]]) -> None:
+    """Atomically write the project name cache. Failures are ignored."""
+    cache_path = get_project_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
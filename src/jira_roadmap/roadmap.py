@@ -1,8 +1,15 @@
 """Roadmap data fetching and processing."""
 
-from datetime import date, timedelta
-
-from jira_roadmap.config import config_exists, load_config
+import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache, partial
+from itertools import zip_longest
+from operator import attrgetter
+
+from jira_roadmap.config import Config, config_exists, load_config
 from jira_roadmap.exceptions import (
     ConfigNotFoundError,
     InvalidConfigError,
@@ -14,9 +21,12 @@ from jira_roadmap.exceptions import (
     RoadmapConfigError,
 )
 from jira_roadmap.jira_client import (
+    SEARCH_PAGE_SIZE,
     AuthenticationError,
+    CachedJiraClient,
     JiraClient,
     RateLimitError,
+    get_shared_client,
 )
 from jira_roadmap.jira_client import (
     ConnectionError as JiraClientConnectionError,
@@ -27,48 +37,220 @@ from jira_roadmap.models import (
     RoadmapResult,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# Maximum issue keys per JQL ``in (...)`` clause; larger sets are split into
+# several searches to stay within JIRA's query length limits.
+JQL_KEYS_PER_QUERY = 500
+
+# Fields each search needs. Initiative dates are derived from their epics, so
+# only epic searches request the configured date fields.
+INITIATIVE_FIELDS = ["summary", "status", "issuelinks", "subtasks"]
+EPIC_FIELDS = ["summary", "status", "issuelinks", "parent"]
+STORY_FIELDS = ["status", "parent"]
+
+# Concurrent follow-up searches per roadmap fetch, unless the config sets max_workers.
+SEARCH_WORKERS = 4
+
 
 def _parse_date_field(fields: dict, field_id: str) -> date | None:
     """Parse a JIRA custom date field value to a date object."""
     value = fields.get(field_id)
     if not value:
         return None
+    if not isinstance(value, str):
+        value = str(value)
+    # JIRA date fields are typically "YYYY-MM-DD"
+    return _parse_iso_date(value[:10])
+
+
+@lru_cache(maxsize=2048)
+def _parse_iso_date(value: str) -> date | None:
+    """Parse a "YYYY-MM-DD" string, cached since epics often share dates."""
     try:
-        # JIRA date fields are typically "YYYY-MM-DD"
-        return date.fromisoformat(str(value)[:10])
-    except (ValueError, TypeError):
+        return date.fromisoformat(value)
+    except ValueError:
         return None
 
 
+@lru_cache(maxsize=256)
+def _add_months(d: date, months: int) -> date:
+    """Return the first day of the month ``months`` months after ``d``'s month."""
+    month_index = d.month - 1 + months
+    return date(d.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+_CATEGORY_KEYS = frozenset({"new", "indeterminate", "done"})
+# Substring of a category name → status category, for unrecognized category keys
+_CATEGORY_NAME_FALLBACK = (
+    ("done", "done"),
+    ("progress", "indeterminate"),
+    ("indeterminate", "indeterminate"),
+)
+_NO_CATEGORY: dict = {}
+
+
 def _get_status_category(status_field: dict) -> str:
     """Extract the status category key from a JIRA status field.
 
     Returns one of: "new", "indeterminate", "done", "cancelled".
+    """
+    category = status_field.get("statusCategory") or _NO_CATEGORY
+    return _status_category(
+        status_field.get("name", ""), category.get("key", ""), category.get("name", "")
+    )
+
+
+@lru_cache(maxsize=128)
+def _status_category(status_name: str, category_key: str, category_name: str) -> str:
+    """Map a status name and its category to a status category key.
 
     Cancelled statuses share the "done" statusCategory key in JIRA, so we
     detect them by checking the status name before consulting the category.
+    Cached because a roadmap only uses a handful of distinct statuses.
     """
-    if "cancel" in status_field.get("name", "").lower():
+    if "cancel" in status_name.lower():
         return "cancelled"
-    category = status_field.get("statusCategory", {})
-    key = category.get("key", "").lower()
-    if key in ("new", "indeterminate", "done"):
+    key = category_key.lower()
+    if key in _CATEGORY_KEYS:
         return key
-    # Fallback based on category name
-    name = category.get("name", "").lower()
-    if "done" in name:
-        return "done"
-    if "progress" in name or "indeterminate" in name:
-        return "indeterminate"
+    name = category_name.lower()
+    for fragment, category in _CATEGORY_NAME_FALLBACK:
+        if fragment in name:
+            return category
     return "new"
 
 
-def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResult:
+@dataclass(slots=True)
+class _InitiativeStaging:
+    """Per-initiative state carried from link extraction to model construction."""
+
+    key: str
+    fields: dict
+    epic_keys: list[str] = field(default_factory=list)  # in discovery order
+    epic_keys_seen: set[str] = field(default_factory=set)
+
+
+def _stage_initiatives(
+    raw_initiatives: list[dict], link_types: list[str] | None
+) -> tuple[dict[str, _InitiativeStaging], set[str], list[tuple[str, str]]]:
+    """Collect each initiative's epics and the dependency links between initiatives.
+
+    Epics come from issue links (subject to the link type filter) and from
+    Epic-type subtasks.
+
+    Returns:
+        Staging records keyed by initiative key (in query order), the set of
+        all epic keys found, and (from_key, to_key) initiative dependencies.
+    """
+    epic_keys_set: set[str] = set()
+    staged: dict[str, _InitiativeStaging] = {}
+    initiative_keys_set: set[str] = {issue["key"] for issue in raw_initiatives}
+    initiative_deps: list[tuple[str, str]] = []
+    seen_init_deps: set[tuple[str, str]] = set()
+    link_types_set = frozenset(link_types) if link_types else None
+
+    for issue in raw_initiatives:
+        issue_key = issue["key"]
+        fields = issue.get("fields", {})
+        issue_links = fields.get("issuelinks", [])
+        staging = _InitiativeStaging(key=issue_key, fields=fields)
+        linked_epics = staging.epic_keys
+        linked_epics_seen = staging.epic_keys_seen
+
+        for link in issue_links:
+            outward = link.get("outwardIssue")
+            inward = link.get("inwardIssue")
+
+            # Collect initiative→initiative dependencies from outward links only
+            # (outward-only avoids double-counting since the inward side is the mirror)
+            if outward:
+                other_key = outward.get("key", "")
+                if other_key and other_key in initiative_keys_set and other_key != issue_key:
+                    pair = (issue_key, other_key)
+                    if pair not in seen_init_deps:
+                        seen_init_deps.add(pair)
+                        initiative_deps.append(pair)
+
+            # Check link type filter for epic collection
+            if link_types_set is not None:
+                link_type_name = (link.get("type") or {}).get("name", "")
+                if link_type_name not in link_types_set:
+                    continue
+
+            # Check both inward and outward linked issues for epics
+            for linked_issue in (inward, outward):
+                if not linked_issue:
+                    continue
+                linked_fields = linked_issue.get("fields") or {}
+                if (linked_fields.get("issuetype") or {}).get("name") == "Epic":
+                    linked_key = linked_issue.get("key")
+                    if linked_key and linked_key not in linked_epics_seen:
+                        linked_epics_seen.add(linked_key)
+                        linked_epics.append(linked_key)
+                        epic_keys_set.add(linked_key)
+
+        # Also collect epics from child work items (parent-child hierarchy)
+        for subtask in fields.get("subtasks", []):
+            subtask_type = subtask.get("fields", {}).get("issuetype", {}).get("name", "")
+            if subtask_type == "Epic":
+                subtask_key = subtask.get("key", "")
+                if subtask_key and subtask_key not in linked_epics_seen:
+                    linked_epics_seen.add(subtask_key)
+                    linked_epics.append(subtask_key)
+                    epic_keys_set.add(subtask_key)
+
+        staged[issue_key] = staging
+
+    return staged, epic_keys_set, initiative_deps
+
+
+def _chunks(keys: list[str], size: int = JQL_KEYS_PER_QUERY) -> list[list[str]]:
+    """Split issue keys into chunks small enough for a JQL ``in (...)`` clause."""
+    return [keys[i:i + size] for i in range(0, len(keys), size)]
+
+
+def _parent_in_jql(keys: list[str]) -> str:
+    """Build a JQL query for the children of the given issues."""
+    return "parent in (" + ", ".join(keys) + ")"
+
+
+def _search_or_empty(
+    client: JiraClient,
+    jql: str,
+    date_fields: list[str],
+    fields: list[str],
+    batch_size: int = SEARCH_PAGE_SIZE,
+) -> list[dict]:
+    """Run a follow-up search, returning no issues if it fails.
+
+    Follow-up searches enrich the initiatives already found, so a failure
+    degrades the roadmap instead of aborting it.
+    """
+    try:
+        return client.search_roadmap_issues(
+            jql, date_fields=date_fields, fields=fields, batch_size=batch_size
+        )
+    except (AuthenticationError, RateLimitError, JiraClientConnectionError, ValueError):
+        return []
+
+
+def fetch_roadmap(
+    jql: str,
+    link_types: list[str] | None = None,
+    use_cache: bool = False,
+    batch_size: int = SEARCH_PAGE_SIZE,
+) -> RoadmapResult:
     """Fetch roadmap data from JIRA.
 
     Args:
         jql: JQL query for finding initiatives
         link_types: Optional list of link type names to filter by
+        use_cache: Reuse JIRA search results cached within the last minute
+        batch_size: Issues requested per search page
 
     Returns:
         RoadmapResult with initiatives and their linked epics
@@ -91,6 +273,10 @@ def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResul
 
     try:
         config = load_config()
+    except FileNotFoundError:
+        raise ConfigNotFoundError(
+            "Configuration not found. Create ~/.jira-roadmap/config.toml to set up."
+        )
     except ValueError as e:
         raise InvalidConfigError(f"Invalid configuration: {e}")
 
@@ -101,23 +287,39 @@ def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResul
             "~/.jira-roadmap/config.toml with start_date_field and end_date_field."
         )
 
+    client = get_shared_client(config, CachedJiraClient if use_cache else JiraClient)
+    return _build_roadmap(client, config, jql, link_types, batch_size)
+
+
+def _build_roadmap(
+    client: JiraClient,
+    config: Config,
+    jql: str,
+    link_types: list[str] | None,
+    batch_size: int = SEARCH_PAGE_SIZE,
+) -> RoadmapResult:
+    """Run the roadmap searches with an open client and assemble the result.
+
+    Raises the same JIRA-related errors as ``fetch_roadmap``.
+    """
     start_field = config.start_date_field
     end_field = config.end_date_field
     date_fields = [start_field, end_field]
 
-    client = JiraClient(config)
-
     # Fetch initiatives
     try:
-        raw_initiatives = client.search_roadmap_issues(jql, date_fields=date_fields)
+        raw_initiatives = client.search_roadmap_issues(
+            jql, fields=INITIATIVE_FIELDS, batch_size=batch_size
+        )
     except AuthenticationError:
         raise JiraAuthError(
             "JIRA authentication failed. Check your credentials in "
             "~/.jira-roadmap/config.toml."
         )
-    except RateLimitError:
+    except RateLimitError as e:
         raise JiraRateLimitError(
-            "JIRA rate limit exceeded. Please wait a moment and try again."
+            "JIRA rate limit exceeded. Please wait a moment and try again.",
+            retry_after=e.retry_after,
         )
     except JiraClientConnectionError as e:
         raise JiraConnectionError(str(e))
@@ -128,92 +330,69 @@ def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResul
         raise NoIssuesFoundError("No issues found matching your query.")
 
     jira_url = config.jira_url.rstrip("/")
+    browse_prefix = jira_url + "/browse/"
 
     # Extract linked epic keys from initiatives, and initiative→initiative dependency links
-    epic_keys_set: set[str] = set()
-    initiative_epic_links: dict[str, list[str]] = {}  # initiative_key -> [epic_keys]
-    initiative_keys_set: set[str] = {issue["key"] for issue in raw_initiatives}
-    initiative_deps: list[tuple[str, str]] = []
-    seen_init_deps: set[tuple[str, str]] = set()
-
-    for issue in raw_initiatives:
-        issue_key = issue["key"]
-        fields = issue.get("fields", {})
-        issue_links = fields.get("issuelinks", [])
-        linked_epics: list[str] = []
-
-        for link in issue_links:
-            link_type_name = link.get("type", {}).get("name", "")
-
-            # Collect initiative→initiative dependencies from outward links only
-            # (outward-only avoids double-counting since the inward side is the mirror)
-            outward = link.get("outwardIssue")
-            if outward:
-                other_key = outward.get("key", "")
-                if other_key and other_key in initiative_keys_set and other_key != issue_key:
-                    pair = (issue_key, other_key)
-                    if pair not in seen_init_deps:
-                        seen_init_deps.add(pair)
-                        initiative_deps.append(pair)
-
-            # Check link type filter for epic collection
-            if link_types and link_type_name not in link_types:
-                continue
-
-            # Check both inward and outward linked issues for epics
-            for direction in ("inwardIssue", "outwardIssue"):
-                linked_issue = link.get(direction)
-                if not linked_issue:
+    staged, epic_keys_set, initiative_deps = _stage_initiatives(raw_initiatives, link_types)
+
+    # Fetch linked epics together with child epics found via the JIRA parent field
+    # (company-managed projects with issue hierarchy don't surface these in issuelinks
+    # or subtasks) in one search per key chunk. The issue stubs inlined in issuelinks
+    # only carry summary, status, priority and issuetype, never custom fields, so the
+    # epics' roadmap dates can't be read from the initiative search itself.
+    # Child stories/tasks of the already-known linked epics are fetched
+    # concurrently via the parent field.
+    # (The subtasks field only captures JIRA Sub-task type issues, not Stories.)
+    # Keys keep discovery order rather than being sorted: JIRA ignores order in
+    # ``in (...)`` and a stable order keeps the JQL (and search cache keys) repeatable.
+    initiative_keys = list(staged)
+    linked_epic_keys = list(
+        dict.fromkeys(key for staging in staged.values() for key in staging.epic_keys)
+    )
+    epics_jqls = []
+    for init_chunk, epic_chunk in zip_longest(_chunks(initiative_keys), _chunks(linked_epic_keys)):
+        clauses = []
+        if init_chunk:
+            clauses.append("(issueType = Epic AND parent in (" + ", ".join(init_chunk) + "))")
+        if epic_chunk:
+            clauses.append("key in (" + ", ".join(epic_chunk) + ")")
+        epics_jqls.append(" OR ".join(clauses))
+
+    search = partial(_search_or_empty, client, batch_size=batch_size)
+    with ThreadPoolExecutor(max_workers=config.max_workers or SEARCH_WORKERS) as executor:
+        epics_futures = [
+            executor.submit(search, jql, date_fields, EPIC_FIELDS)
+            for jql in epics_jqls
+        ]
+        stories_futures = [
+            executor.submit(search, _parent_in_jql(chunk), [], STORY_FIELDS)
+            for chunk in _chunks(linked_epic_keys)
+        ]
+
+        epic_data: dict[str, dict] = {}
+        child_epic_keys: list[str] = []
+        for future in epics_futures:
+            for epic in future.result():
+                epic_key = epic["key"]
+                parent_key = epic.get("fields", {}).get("parent", {}).get("key", "")
+                parent = staged.get(parent_key)
+                if parent is not None:
+                    if epic_key not in parent.epic_keys_seen:
+                        parent.epic_keys_seen.add(epic_key)
+                        parent.epic_keys.append(epic_key)
+                        if epic_key not in epic_keys_set:
+                            epic_keys_set.add(epic_key)
+                            child_epic_keys.append(epic_key)
+                elif epic_key not in epic_keys_set:
                     continue
-                linked_type = linked_issue.get("fields", {}).get("issuetype", {}).get("name", "")
-                if linked_type == "Epic":
-                    linked_key = linked_issue.get("key", "")
-                    if linked_key:
-                        linked_epics.append(linked_key)
-                        epic_keys_set.add(linked_key)
+                epic_data[epic_key] = epic
 
-        # Also collect epics from child work items (parent-child hierarchy)
-        for subtask in fields.get("subtasks", []):
-            subtask_type = subtask.get("fields", {}).get("issuetype", {}).get("name", "")
-            if subtask_type == "Epic":
-                subtask_key = subtask.get("key", "")
-                if subtask_key and subtask_key not in linked_epics:
-                    linked_epics.append(subtask_key)
-                    epic_keys_set.add(subtask_key)
-
-        initiative_epic_links[issue_key] = linked_epics
-
-    # Find additional child epics via the JIRA parent field (company-managed projects
-    # with issue hierarchy don't surface these in issuelinks or subtasks).
-    initiative_keys = [issue["key"] for issue in raw_initiatives]
-    parent_jql = "issueType = Epic AND parent in (" + ", ".join(initiative_keys) + ")"
-    try:
-        parent_child_epics = client.search_roadmap_issues(parent_jql, date_fields=date_fields)
-    except (AuthenticationError, RateLimitError, JiraClientConnectionError, ValueError):
-        parent_child_epics = []
-
-    for child in parent_child_epics:
-        child_key = child["key"]
-        parent_key = child.get("fields", {}).get("parent", {}).get("key", "")
-        if parent_key not in initiative_epic_links:
-            continue
-        existing = initiative_epic_links[parent_key]
-        if child_key not in existing:
-            existing.append(child_key)
-            epic_keys_set.add(child_key)
-
-    # Fetch epics in bulk if any were found
-    epic_data: dict[str, dict] = {}
-    if epic_keys_set:
-        epic_keys_jql = "key in (" + ", ".join(sorted(epic_keys_set)) + ")"
-        try:
-            raw_epics = client.search_roadmap_issues(epic_keys_jql, date_fields=date_fields)
-        except (AuthenticationError, RateLimitError, JiraClientConnectionError, ValueError):
-            # If epic fetch fails, continue without epic details
-            raw_epics = []
-
-        for epic in raw_epics:
-            epic_data[epic["key"]] = epic
+        # Child epics discovered above need their own story search.
+        stories_futures.extend(
+            executor.submit(search, _parent_in_jql(chunk), [], STORY_FIELDS)
+            for chunk in _chunks(child_epic_keys)
+        )
+        raw_stories = [story for future in stories_futures for story in future.result()]
 
     # Collect epic→epic dependency links from the epics' own issuelinks (outward only)
     epic_deps: list[tuple[str, str]] = []
@@ -229,44 +408,34 @@ def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResul
                         seen_epic_deps.add(pair)
                         epic_deps.append(pair)
 
-    # Fetch child stories/tasks for each epic via the parent field.
-    # (The subtasks field only captures JIRA Sub-task type issues, not Stories.)
-    story_counts: dict[str, dict] = {}
-    if epic_keys_set:
-        stories_jql = "parent in (" + ", ".join(sorted(epic_keys_set)) + ")"
-        try:
-            raw_stories = client.search_roadmap_issues(stories_jql, date_fields=[])
-        except (AuthenticationError, RateLimitError, JiraClientConnectionError, ValueError):
-            raw_stories = []
-
-        for story in raw_stories:
-            parent_key = story.get("fields", {}).get("parent", {}).get("key", "")
-            if not parent_key or parent_key not in epic_keys_set:
-                continue
-            counts = story_counts.setdefault(
-                parent_key, {"done": 0, "cancelled": 0, "inprogress": 0, "total": 0}
-            )
-            counts["total"] += 1
-            cat = _get_status_category(story.get("fields", {}).get("status", {}))
-            if cat == "done":
-                counts["done"] += 1
-            elif cat == "cancelled":
-                counts["cancelled"] += 1
-            elif cat == "indeterminate":
-                counts["inprogress"] += 1
+    # Count child stories/tasks per (epic, status category)
+    story_counts: Counter[tuple[str, str]] = Counter()
+    for story in raw_stories:
+        story_fields = story.get("fields", {})
+        parent_key = story_fields.get("parent", {}).get("key", "")
+        if parent_key in epic_keys_set:
+            story_counts[parent_key, _get_status_category(story_fields.get("status", {}))] += 1
 
     # Build RoadmapInitiative objects
     initiatives: list[RoadmapInitiative] = []
-    all_dates: list[date] = []
+    # Earliest and latest epic dates; initiative dates are derived from these too
+    earliest: date | None = None
+    latest: date | None = None
 
-    for issue in raw_initiatives:
-        issue_key = issue["key"]
-        fields = issue.get("fields", {})
+    for staging in staged.values():
+        issue_key = staging.key
+        fields = staging.fields
         status_field = fields.get("status", {})
 
-        # Build epics for this initiative
+        # Build epics for this initiative, tracking the date range they span.
+        # If any epic is missing a start or end date we treat that boundary as
+        # unknown for the initiative too — we can't claim a definite start when
+        # some epics haven't been scheduled yet.
         epics: list[RoadmapEpic] = []
-        for epic_key in initiative_epic_links.get(issue_key, []):
+        min_start: date | None = None
+        max_end: date | None = None
+        missing_start = missing_end = False
+        for epic_key in staging.epic_keys:
             epic_raw = epic_data.get(epic_key)
             if not epic_raw:
                 continue
@@ -274,12 +443,10 @@ def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResul
             epic_status = epic_fields.get("status", {})
             epic_start = _parse_date_field(epic_fields, start_field)
             epic_end = _parse_date_field(epic_fields, end_field)
-
-            counts = story_counts.get(epic_key, {})
-            done_stories = counts.get("done", 0)
-            cancelled_stories = counts.get("cancelled", 0)
-            inprogress_stories = counts.get("inprogress", 0)
-            total_stories = counts.get("total", 0)
+            done_stories = story_counts[epic_key, "done"]
+            cancelled_stories = story_counts[epic_key, "cancelled"]
+            inprogress_stories = story_counts[epic_key, "indeterminate"]
+            new_stories = story_counts[epic_key, "new"]
 
             epic = RoadmapEpic(
                 key=epic_key,
@@ -288,34 +455,34 @@ def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResul
                 status_category=_get_status_category(epic_status),
                 start_date=epic_start,
                 end_date=epic_end,
-                url=f"{jira_url}/browse/{epic_key}",
+                url=browse_prefix + epic_key,
                 done_stories=done_stories,
                 cancelled_stories=cancelled_stories,
                 inprogress_stories=inprogress_stories,
-                total_stories=total_stories,
+                total_stories=done_stories + cancelled_stories + inprogress_stories + new_stories,
             )
             epics.append(epic)
 
+            for epic_date in (epic_start, epic_end):
+                if epic_date:
+                    if earliest is None or epic_date < earliest:
+                        earliest = epic_date
+                    if latest is None or epic_date > latest:
+                        latest = epic_date
             if epic_start:
-                all_dates.append(epic_start)
+                if min_start is None or epic_start < min_start:
+                    min_start = epic_start
+            else:
+                missing_start = True
             if epic_end:
-                all_dates.append(epic_end)
+                if max_end is None or epic_end > max_end:
+                    max_end = epic_end
+            else:
+                missing_end = True
 
-        # Derive initiative dates from epics.
-        # If any epic is missing a start or end date we treat that boundary as
-        # unknown for the initiative too — we can't claim a definite start when
-        # some epics haven't been scheduled yet.
-        epic_starts = [e.start_date for e in epics if e.start_date]
-        epic_ends = [e.end_date for e in epics if e.end_date]
-        all_have_start = epics and all(e.start_date for e in epics)
-        all_have_end = epics and all(e.end_date for e in epics)
-        init_start = min(epic_starts) if all_have_start else None
-        init_end = max(epic_ends) if all_have_end else None
-
-        if init_start:
-            all_dates.append(init_start)
-        if init_end:
-            all_dates.append(init_end)
+        # Derive initiative dates from epics
+        init_start = None if missing_start else min_start
+        init_end = None if missing_end else max_end
 
         initiative = RoadmapInitiative(
             key=issue_key,
@@ -325,36 +492,35 @@ def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResul
             start_date=init_start,
             end_date=init_end,
             epics=epics,
-            url=f"{jira_url}/browse/{issue_key}",
+            url=browse_prefix + issue_key,
         )
         initiatives.append(initiative)
 
     # Calculate timeline bounds
     today = date.today()
-    if all_dates:
-        timeline_start = min(all_dates)
-        timeline_end = max(all_dates)
+    if earliest and latest:
+        timeline_start = earliest
+        timeline_end = latest
     else:
         # No dates found - default to current year
         timeline_start = today.replace(month=1, day=1)
         timeline_end = today.replace(month=12, day=31)
 
     # Ensure the timeline always extends at least 11 months into the future
-    future_month = today.month + 11
-    eleven_months_out = date(today.year + (future_month - 1) // 12, (future_month - 1) % 12 + 1, 1)
+    eleven_months_out = _add_months(today, 11)
     if timeline_end < eleven_months_out:
         timeline_end = eleven_months_out
 
     # Add padding: 1 month before and after
-    timeline_start = (timeline_start.replace(day=1) - timedelta(days=1)).replace(day=1)
-    timeline_end = (timeline_end.replace(day=28) + timedelta(days=5)).replace(day=1)
+    timeline_start = _add_months(timeline_start, -1)
+    timeline_end = _add_months(timeline_end, 1)
 
     # Collect unique project keys from all initiatives and epics, then resolve names
     all_project_keys: set[str] = set()
     for init in initiatives:
-        all_project_keys.add(init.key.split("-")[0])
+        all_project_keys.add(init.key.partition("-")[0])
         for epic in init.epics:
-            all_project_keys.add(epic.key.split("-")[0])
+            all_project_keys.add(epic.key.partition("-")[0])
     project_names = client.get_project_names(sorted(all_project_keys))
 
     return RoadmapResult(
@@ -369,39 +535,50 @@ def fetch_roadmap(jql: str, link_types: list[str] | None = None) -> RoadmapResul
     )
 
 
+_EPIC_ATTRS = attrgetter(
+    "key", "title", "status", "status_category", "start_date", "end_date", "url",
+    "done_stories", "cancelled_stories", "inprogress_stories", "total_stories",
+)
+_INITIATIVE_ATTRS = attrgetter(
+    "key", "title", "status", "status_category", "start_date", "end_date", "epics", "url",
+)
+
+
 def roadmap_result_to_dict(result: RoadmapResult) -> dict:
     """Convert RoadmapResult to a JSON-serializable dict for the template."""
-
-    def _date_str(d: date | None) -> str | None:
-        return d.isoformat() if d else None
-
-    def _epic_dict(e: RoadmapEpic) -> dict:
-        return {
-            "key": e.key,
-            "title": e.title,
-            "status": e.status,
-            "status_category": e.status_category,
-            "start_date": _date_str(e.start_date),
-            "end_date": _date_str(e.end_date),
-            "url": e.url,
-            "done_stories": e.done_stories,
-            "cancelled_stories": e.cancelled_stories,
-            "inprogress_stories": e.inprogress_stories,
-            "total_stories": e.total_stories,
+    initiatives = [
+        {
+            "key": key,
+            "title": title,
+            "status": status,
+            "status_category": status_category,
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+            "epics": [
+                {
+                    "key": e_key,
+                    "title": e_title,
+                    "status": e_status,
+                    "status_category": e_status_category,
+                    "start_date": e_start.isoformat() if e_start else None,
+                    "end_date": e_end.isoformat() if e_end else None,
+                    "url": e_url,
+                    "done_stories": done,
+                    "cancelled_stories": cancelled,
+                    "inprogress_stories": inprogress,
+                    "total_stories": total,
+                }
+                for (
+                    e_key, e_title, e_status, e_status_category, e_start, e_end, e_url,
+                    done, cancelled, inprogress, total,
+                ) in map(_EPIC_ATTRS, epics)
+            ],
+            "url": url,
         }
-
-    initiatives = []
-    for init in result.initiatives:
-        initiatives.append({
-            "key": init.key,
-            "title": init.title,
-            "status": init.status,
-            "status_category": init.status_category,
-            "start_date": _date_str(init.start_date),
-            "end_date": _date_str(init.end_date),
-            "epics": [_epic_dict(e) for e in init.epics],
-            "url": init.url,
-        })
+        for (
+            key, title, status, status_category, start_date, end_date, epics, url,
+        ) in map(_INITIATIVE_ATTRS, result.initiatives)
+    ]
 
     return {
         "initiatives": initiatives,
@@ -413,3 +590,14 @@ def roadmap_result_to_dict(result: RoadmapResult) -> dict:
         "epic_deps": [[a, b] for a, b in result.epic_deps],
         "project_names": result.project_names,
     }
+
+
+def roadmap_result_to_json(result: RoadmapResult) -> bytes:
+    """Serialize RoadmapResult to JSON bytes matching ``roadmap_result_to_dict``.
+
+    Uses orjson when installed, which serializes the dataclasses and dates
+    natively without building the intermediate dict.
+    """
+    if orjson is not None:
+        return orjson.dumps(result)
+    return json.dumps(roadmap_result_to_dict(result)).encode()
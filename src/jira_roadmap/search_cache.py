@@ -0,0 +1,110 @@
+"""Short-lived cache of JIRA search results, in memory and on disk."""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from jira_roadmap.config import get_config_dir
+
+# Re-rendering the same roadmap within this window reuses the previous results.
+SEARCH_CACHE_TTL_SECONDS = 60
+
+# Most searches kept in memory; the oldest are dropped first.
+SEARCH_CACHE_MAX_ENTRIES = 128
+
+# In-process layer in front of the files: cache key → (expires_at, issues).
+_MEMORY_CACHE: dict[str, tuple[float, list[dict]]] = {}
+_MEMORY_CACHE_LOCK = threading.Lock()
+
+
+def get_search_cache_dir() -> Path:
+    """Get the search result cache directory path."""
+    return get_config_dir() / "cache"
+
+
+def search_cache_key(*parts: str) -> str:
+    """Build a cache key from the parts that identify a search."""
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_cached_search(key: str) -> list[dict] | None:
+    """Return cached issues for a search, or None if missing or expired."""
+    now = time.time()
+    with _MEMORY_CACHE_LOCK:
+        entry = _MEMORY_CACHE.get(key)
+        if entry and entry[0] <= now:
+            del _MEMORY_CACHE[key]
+            entry = None
+    if entry:
+        return entry[1]
+
+    path = get_search_cache_dir() / f"{key}.json.gz"
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        expires_at = float(data["expires_at"])
+        issues = data["payload"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if expires_at <= now:
+        path.unlink(missing_ok=True)
+        return None
+
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE[key] = (expires_at, issues)
+    return issues
+
+
+def put_cached_search(
+    key: str, issues: list[dict], ttl: float = SEARCH_CACHE_TTL_SECONDS
+) -> None:
+    """Store issues for a search and drop expired entries.
+
+    Disk write failures are ignored.
+    """
+    now = time.time()
+    expires_at = now + ttl
+    with _MEMORY_CACHE_LOCK:
+        for stale in [k for k, (expires, _) in _MEMORY_CACHE.items() if expires <= now]:
+            del _MEMORY_CACHE[stale]
+        _MEMORY_CACHE.pop(key, None)
+        while len(_MEMORY_CACHE) >= SEARCH_CACHE_MAX_ENTRIES:
+            del _MEMORY_CACHE[next(iter(_MEMORY_CACHE))]
+        _MEMORY_CACHE[key] = (expires_at, issues)
+
+    cache_dir = get_search_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            json.dump({"expires_at": expires_at, "payload": issues}, f)
+        os.replace(tmp_name, cache_dir / f"{key}.json.gz")
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+    _prune_search_cache_dir(cache_dir, now)
+
+
+def _prune_search_cache_dir(cache_dir: Path, now: float) -> None:
+    """Delete cache files last written more than SEARCH_CACHE_TTL_SECONDS ago."""
+    for path in cache_dir.glob("*.json.gz"):
+        try:
+            if path.stat().st_mtime + SEARCH_CACHE_TTL_SECONDS <= now:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search results, in memory and on disk."""
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE.clear()
+    shutil.rmtree(get_search_cache_dir(), ignore_errors=True)
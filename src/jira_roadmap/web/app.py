@@ -1,13 +1,60 @@
 """Flask application factory for JIRA Roadmap web interface."""
 
+import os
+from typing import Any
+
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import ChoiceLoader, ModuleLoader
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used when it is installed."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj with the same output as Flask's default provider.
+
+        Dates still go through ``default`` (HTTP date strings), and calls with
+        formatting arguments orjson can't honor, such as ``indent``, are left to
+        the stdlib provider.
+        """
+        if kwargs.keys() - {"sort_keys"}:
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON text or bytes."""
+        return orjson.loads(s)
 
 
 def create_app() -> Flask:
     """Create and configure the Flask application."""
-    app = Flask(__name__)
+    # Static files are served by the blueprint; an app-level /static route
+    # would duplicate it for the same folder.
+    app = Flask(__name__, static_folder=None)
 
     app.config["SECRET_KEY"] = "jira-roadmap-local-dev"
+    # Deployments that don't want the built-in demo can set JIRA_ROADMAP_DEMO=0.
+    app.config["DEMO_ENABLED"] = os.environ.get("JIRA_ROADMAP_DEMO", "1") != "0"
+
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+    # Templates precompiled by `python -m jira_roadmap.web.precompile`, if any;
+    # the source templates remain the fallback.
+    compiled_templates = os.environ.get("JIRA_ROADMAP_COMPILED_TEMPLATES")
+    if compiled_templates:
+        app.jinja_env.loader = ChoiceLoader(
+            [ModuleLoader(compiled_templates), app.jinja_env.loader]
+        )
 
     from jira_roadmap.web.routes import bp
     app.register_blueprint(bp)
@@ -0,0 +1,48 @@
+"""In-memory TTL cache for web responses."""
+
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Small thread-safe mapping whose entries expire after ``ttl`` seconds.
+
+    When full, expired entries are dropped first, then the oldest ones.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for key, evicting entries if the cache is full."""
+        now = time.monotonic()
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                for stale in [k for k, (expires, _) in self._data.items() if expires <= now]:
+                    del self._data[stale]
+                while len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
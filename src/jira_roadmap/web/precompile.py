@@ -0,0 +1,37 @@
+"""Precompile the web templates to Python modules.
+
+Usage: python -m jira_roadmap.web.precompile [TARGET_DIR]
+
+Point JIRA_ROADMAP_COMPILED_TEMPLATES at the target directory and the app
+loads templates from it, skipping Jinja parsing on worker start.
+"""
+
+import sys
+from pathlib import Path
+
+from jira_roadmap.web.app import create_app
+
+DEFAULT_TARGET = Path("build/compiled-templates")
+
+
+def compile_templates(target: Path = DEFAULT_TARGET) -> None:
+    """Compile every app template into ``target``.
+
+    Uses the app's own Jinja settings so autoescaping and globals match what
+    the running app expects, always reading the source templates.
+    """
+    app = create_app()
+    env = app.jinja_env.overlay(loader=app.create_global_jinja_loader())
+    env.compile_templates(str(target), zip=None, ignore_errors=False)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Compile templates into the directory given on the command line."""
+    args = sys.argv[1:] if argv is None else argv
+    target = Path(args[0]) if args else DEFAULT_TARGET
+    compile_templates(target)
+    print(f"Compiled templates written to {target}")
+
+
+if __name__ == "__main__":
+    main()
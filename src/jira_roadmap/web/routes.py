@@ -1,8 +1,25 @@
 """HTTP route handlers for JIRA Roadmap web interface."""
 
+import json
+import math
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, timedelta
 
-from flask import Blueprint, jsonify, render_template, request
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    jsonify,
+    render_template,
+    request,
+    stream_template,
+)
+from flask.blueprints import BlueprintSetupState
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
 
 from jira_roadmap.config import config_exists, load_config
 from jira_roadmap.exceptions import (
@@ -16,239 +33,451 @@ from jira_roadmap.exceptions import (
     RoadmapConfigError,
     RoadmapError,
 )
-from jira_roadmap.jira_client import AuthenticationError, JiraClient
+from jira_roadmap.jira_client import (
+    SEARCH_PAGE_SIZE,
+    AuthenticationError,
+    RateLimitError,
+    get_shared_client,
+)
 from jira_roadmap.jira_client import ConnectionError as JiraClientConnectionError
-from jira_roadmap.roadmap import fetch_roadmap, roadmap_result_to_dict
+from jira_roadmap.roadmap import fetch_roadmap, roadmap_result_to_json
+from jira_roadmap.web.cache import TTLCache
 
 bp = Blueprint("main", __name__, static_folder="static", template_folder="templates")
 
 
+@bp.record_once
+def _prepare_templates(state: BlueprintSetupState) -> None:
+    """Compile index.html at registration so the first request doesn't pay for it."""
+    state.app.jinja_env.get_template("index.html")
+
+
+# Recent roadmaps keyed by (JIRA URL and user, date fields, jql, link types), stored with their
+# embeddable JSON so reloads and filter tweaks neither refetch nor re-serialize them.
+# Submitting with ?refresh=1 bypasses this cache and the JIRA search cache.
+_roadmap_cache = TTLCache(maxsize=32, ttl=30)
+
+# Link types per JIRA instance and user; these change rarely. Failures aren't cached.
+_link_types_cache = TTLCache(maxsize=64, ttl=600)
+
+# Roadmap fetches run here so a POST returns while JIRA is still being queried.
+_roadmap_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="roadmap")
+
+# Submitted fetches (Futures) by job id; the results page polls them until done.
+_roadmap_jobs = TTLCache(maxsize=64, ttl=600)
+
+# Longest JQL accepted from the roadmap form; longer input is rejected before
+# any JIRA request is made.
+MAX_JQL_LENGTH = 4096
+
+# Accepted range for the optional per-page batch size on the roadmap form.
+MIN_BATCH_SIZE = 50
+MAX_BATCH_SIZE = 1000
+
+# Latest job id per (roadmap cache key, refresh), so identical concurrent POSTs share one
+# fetch; a refresh never joins a fetch that may be served from the search cache.
+_roadmap_job_ids = TTLCache(maxsize=64, ttl=600)
+
+# Held while looking up and submitting a roadmap job, so simultaneous POSTs can't both submit.
+_roadmap_jobs_lock = threading.Lock()
+
+# (HTTP status, alert level) for each error a finished roadmap job can report.
+# Subclasses not listed fall back to their nearest listed base class.
+_ROADMAP_ERRORS: dict[type[RoadmapError], tuple[int, str]] = {
+    ConfigNotFoundError: (503, "error"),
+    InvalidConfigError: (503, "error"),
+    RoadmapConfigError: (503, "error"),
+    JiraAuthError: (401, "error"),
+    JiraRateLimitError: (429, "error"),
+    JiraConnectionError: (503, "error"),
+    InvalidJqlError: (400, "error"),
+    NoIssuesFoundError: (200, "warning"),
+    RoadmapError: (500, "error"),
+}
+
+
+_SCRIPT_JSON_ESCAPES = (("<", "\\u003c"), (">", "\\u003e"), ("&", "\\u0026"), ("'", "\\u0027"))
+
+
+def _script_json(data: bytes) -> Markup:
+    """Make serialized JSON safe to embed in a <script> block.
+
+    Escapes the same characters as Jinja's ``tojson`` filter so issue titles
+    can't close the script tag.
+    """
+    text = data.decode("utf-8")
+    for char, escaped in _SCRIPT_JSON_ESCAPES:
+        text = text.replace(char, escaped)
+    return Markup(text)
+
+
+def clear_caches() -> None:
+    """Drop cached roadmaps, roadmap jobs, link types and the rendered demo page."""
+    global _demo_page
+    _roadmap_cache.clear()
+    _link_types_cache.clear()
+    _roadmap_jobs.clear()
+    _roadmap_job_ids.clear()
+    _demo_page = None
+
+
+# Health check bodies never change, so they are serialized once.
+_HEALTH_OK = json.dumps({"status": "ok", "config_loaded": True}).encode()
+_HEALTH_NO_CONFIG = json.dumps({
+    "status": "error",
+    "config_loaded": False,
+    "message": "Configuration not found",
+}).encode()
+
+
 @bp.route("/health")
 def health():
     """Health check endpoint."""
-    config_loaded = config_exists()
-    if config_loaded:
-        return jsonify({"status": "ok", "config_loaded": True})
-    else:
-        return jsonify({
-            "status": "error",
-            "config_loaded": False,
-            "message": "Configuration not found",
-        }), 503
-
-
-@bp.route("/")
+    if config_exists():
+        return Response(_HEALTH_OK, mimetype="application/json")
+    return Response(_HEALTH_NO_CONFIG, status=503, mimetype="application/json")
+
+
+@bp.route("/", methods=["GET", "POST"])
 def index():
-    """Render the roadmap form."""
-    has_config = config_exists()
-    return render_template("index.html", has_config=has_config)
+    """Render the roadmap form (GET) or a submitted roadmap (POST).
 
+    A POST renders a cached roadmap directly, or starts fetching it and
+    renders a page that polls for the result.
+    """
+    has_config = config_exists()
+    if request.method == "GET":
+        return render_template("index.html", has_config=has_config)
 
-@bp.route("/", methods=["POST"])
-def roadmap_post():
-    """Fetch roadmap data and render with results."""
     jql = request.form.get("jql", "").strip()
-    link_types_str = request.form.get("link_types", "").strip()
+    link_types_str = request.form.get("link_types")
 
     if not jql:
         return render_template(
             "index.html",
-            has_config=config_exists(),
+            has_config=has_config,
             error="JQL query is required.",
             jql=jql,
         ), 400
 
-    # Parse link types
+    if len(jql) > MAX_JQL_LENGTH:
+        return render_template(
+            "index.html",
+            has_config=has_config,
+            error=f"JQL query is too long (maximum {MAX_JQL_LENGTH} characters).",
+            jql=jql[:MAX_JQL_LENGTH],
+        ), 400
+
+    # Parse link types; a blank or comma-only field means all link types
     link_types = None
     if link_types_str:
-        link_types = [lt.strip() for lt in link_types_str.split(",") if lt.strip()]
+        link_types = [lt for lt in map(str.strip, link_types_str.split(",")) if lt] or None
 
-    try:
-        result = fetch_roadmap(jql, link_types=link_types)
-    except ConfigNotFoundError as e:
-        return render_template(
-            "index.html", has_config=False, error=str(e), jql=jql,
-        ), 503
-    except (InvalidConfigError, RoadmapConfigError) as e:
-        return render_template(
-            "index.html", has_config=config_exists(), error=str(e), jql=jql,
-        ), 503
-    except JiraAuthError as e:
-        return render_template(
-            "index.html", has_config=config_exists(), error=str(e), jql=jql,
-        ), 401
-    except JiraRateLimitError as e:
-        return render_template(
-            "index.html", has_config=config_exists(), error=str(e), jql=jql,
-        ), 429
-    except JiraConnectionError as e:
+    batch_size_str = request.form.get("batch_size", "").strip()
+    batch_size = SEARCH_PAGE_SIZE
+    if batch_size_str:
+        try:
+            batch_size = int(batch_size_str)
+        except ValueError:
+            batch_size = 0
+        if not MIN_BATCH_SIZE <= batch_size <= MAX_BATCH_SIZE:
+            return render_template(
+                "index.html",
+                has_config=has_config,
+                error=(
+                    f"Batch size must be a whole number from {MIN_BATCH_SIZE} "
+                    f"to {MAX_BATCH_SIZE}."
+                ),
+                jql=jql,
+            ), 400
+
+    config = None
+    if has_config:
+        try:
+            config = load_config()
+        except FileNotFoundError:
+            has_config = False
+        except ValueError:
+            pass  # the fetch job reports the invalid config
+
+    if not has_config:
         return render_template(
-            "index.html", has_config=config_exists(), error=str(e), jql=jql,
+            "index.html",
+            has_config=False,
+            error="Configuration not found. Create ~/.jira-roadmap/config.toml to set up.",
+            jql=jql,
         ), 503
-    except InvalidJqlError as e:
-        return render_template(
-            "index.html", has_config=config_exists(), error=str(e), jql=jql,
-        ), 400
-    except NoIssuesFoundError as e:
-        return render_template(
-            "index.html", has_config=config_exists(), warning=str(e), jql=jql,
-        ), 200
-    except RoadmapError as e:
+
+    # An invalid config has nothing to key on; its fetch fails and isn't cached.
+    cache_key = None
+    if config is not None:
+        cache_key = (
+            config.jira_url,
+            config.jira_email,
+            config.start_date_field,
+            config.end_date_field,
+            jql,
+            tuple(sorted(link_types or ())),
+        )
+    refresh = bool(request.args.get("refresh"))
+    cached = None if refresh or cache_key is None else _roadmap_cache.get(cache_key)
+    if cached is None:
+        # Fetch in the background; the page polls /api/roadmap/<job_id> for the result.
+        job_key = (cache_key, refresh) if cache_key is not None else None
+        with _roadmap_jobs_lock:
+            job_id = _roadmap_job_ids.get(job_key) if job_key is not None else None
+            running = _roadmap_jobs.get(job_id) if job_id else None
+            if running is None or running.done():
+                job_id = uuid.uuid4().hex
+                _roadmap_jobs.set(
+                    job_id,
+                    _roadmap_executor.submit(
+                        _run_roadmap_job, jql, link_types, batch_size, cache_key, not refresh
+                    ),
+                )
+                if job_key is not None:
+                    _roadmap_job_ids.set(job_key, job_id)
         return render_template(
-            "index.html", has_config=config_exists(), error=str(e), jql=jql,
-        ), 500
+            "index.html", has_config=True, result=True, job_id=job_id, jql=jql,
+        )
 
-    return render_template(
+    # Stream the page so the form and styles reach the browser before the
+    # (possibly large) embedded roadmap JSON is written out.
+    result, result_json_str = cached
+    return Response(stream_template(
         "index.html",
         has_config=True,
         result=result,
-        result_json=roadmap_result_to_dict(result),
+        result_json_str=result_json_str,
         jql=jql,
+    ))
+
+
+def _run_roadmap_job(
+    jql: str,
+    link_types: list[str] | None,
+    batch_size: int,
+    cache_key: tuple | None,
+    use_cache: bool,
+) -> bytes:
+    """Fetch a roadmap, cache it for later page views, and return its JSON.
+
+    With ``use_cache`` the JIRA searches themselves may be served from the
+    search cache, so a different link type filter on the same JQL reuses them.
+    """
+    result = fetch_roadmap(
+        jql, link_types=link_types, use_cache=use_cache, batch_size=batch_size
+    )
+    result_json = roadmap_result_to_json(result)
+    if cache_key is not None:
+        _roadmap_cache.set(cache_key, (result, _script_json(result_json)))
+    return result_json
+
+
+@bp.route("/api/roadmap/<job_id>")
+def api_roadmap_job(job_id: str):
+    """Report a background roadmap fetch: pending, done with its data, or failed."""
+    future: Future | None = _roadmap_jobs.get(job_id)
+    if future is None:
+        return jsonify({"status": "error", "error": "Roadmap job not found or expired."}), 404
+    if not future.done():
+        return jsonify({"status": "pending"}), 202
+
+    error = future.exception()
+    if error is None:
+        body = b'{"status":"done","result":' + future.result() + b"}"
+        return Response(body, mimetype="application/json")
+    if not isinstance(error, RoadmapError):
+        raise error
+    status, level = next(
+        _ROADMAP_ERRORS[cls] for cls in type(error).__mro__ if cls in _ROADMAP_ERRORS
     )
+    response = jsonify({"status": level, level: str(error)})
+    response.status_code = status
+    if isinstance(error, JiraRateLimitError):
+        _set_retry_after(response, error.retry_after)
+    return response
+
+
+def _set_retry_after(response: Response, retry_after: float | None) -> None:
+    """Pass JIRA's requested pause on to the browser as a Retry-After header."""
+    if retry_after is not None:
+        response.headers["Retry-After"] = str(math.ceil(retry_after))
+
+
+# Rendered demo page and the date it was built for; the page only changes daily.
+_demo_page: tuple[date, str] | None = None
 
 
 @bp.route("/demo")
 def demo():
     """Render the roadmap with built-in demo data (no JIRA credentials needed)."""
+    global _demo_page
+    if not current_app.config["DEMO_ENABLED"]:
+        abort(404)
     today = date.today()
+    if _demo_page is None or _demo_page[0] != today:
+        result_json = _demo_result_json(today)
+        html = render_template(
+            "index.html",
+            has_config=True,
+            result=True,
+            result_json_str=htmlsafe_json_dumps(result_json),
+            jql=result_json["jql_query"],
+        )
+        _demo_page = (today, html)
+    return _demo_page[1]
 
-    def d(offset_days):
-        return (today + timedelta(days=offset_days)).isoformat()
-
-    result_json = {
-        "jql_query": "type = Initiative AND project = DEMO",
-        "jira_url": "https://demo.atlassian.net",
-        "timeline_start": d(-60),
-        "timeline_end": d(330),
-        # (from, to) pairs — "from" blocks "to"
-        "initiative_deps": [
-            ["INIT-4", "INIT-1"],   # Legacy migration must finish before Platform Modernisation
-            ["INIT-1", "INIT-3"],   # Platform Modernisation before Analytics Dashboard
-        ],
-        "epic_deps": [
-            ["EPIC-1", "EPIC-2"],   # API Gateway migration before Service mesh rollout
-            ["EPIC-2", "EPIC-3"],   # Service mesh rollout before Observability uplift
-            ["EPIC-4", "EPIC-5"],   # iOS MVP before Android MVP
-        ],
-        "initiatives": [
-            {
-                "key": "INIT-1", "title": "Platform Modernisation",
-                "status": "In Progress", "status_category": "indeterminate",
-                "start_date": d(-45), "end_date": d(180),
-                "url": "#",
-                "epics": [
-                    {"key": "EPIC-1", "title": "API Gateway migration",
-                     "status": "In Progress", "status_category": "indeterminate",
-                     "start_date": d(-45), "end_date": d(45), "url": "#",
-                     "done_stories": 5, "inprogress_stories": 2, "cancelled_stories": 0,
-                     "total_stories": 8},
-                    {"key": "EPIC-2", "title": "Service mesh rollout",
-                     "status": "To Do", "status_category": "new",
-                     "start_date": d(30), "end_date": d(120), "url": "#",
-                     "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
-                     "total_stories": 6},
-                    {"key": "EPIC-3", "title": "Observability uplift",
-                     "status": "To Do", "status_category": "new",
-                     "start_date": d(90), "end_date": d(180), "url": "#",
-                     "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
-                     "total_stories": 4},
-                ],
-            },
-            {
-                "key": "INIT-2", "title": "Mobile App Launch",
-                "status": "In Progress", "status_category": "indeterminate",
-                "start_date": d(-20), "end_date": d(150),
-                "url": "#",
-                "epics": [
-                    {"key": "EPIC-4", "title": "iOS MVP",
-                     "status": "In Progress", "status_category": "indeterminate",
-                     "start_date": d(-20), "end_date": d(60), "url": "#",
-                     "done_stories": 7, "inprogress_stories": 2, "cancelled_stories": 1,
-                     "total_stories": 10},
-                    {"key": "EPIC-5", "title": "Android MVP",
-                     "status": "To Do", "status_category": "new",
-                     "start_date": d(50), "end_date": d(120), "url": "#",
-                     "done_stories": 2, "inprogress_stories": 0, "cancelled_stories": 0,
-                     "total_stories": 9},
-                    {"key": "EPIC-6", "title": "Push notifications",
-                     "status": "To Do", "status_category": "new",
-                     "start_date": d(100), "end_date": d(150), "url": "#",
-                     "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
-                     "total_stories": 3},
-                ],
-            },
-            {
-                "key": "INIT-3", "title": "Analytics Dashboard",
-                "status": "To Do", "status_category": "new",
-                "start_date": d(60), "end_date": d(270),
-                "url": "#",
-                "epics": [
-                    {"key": "EPIC-7", "title": "Data pipeline",
-                     "status": "To Do", "status_category": "new",
-                     "start_date": d(60), "end_date": d(150), "url": "#",
-                     "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
-                     "total_stories": 7},
-                    {"key": "EPIC-8", "title": "Dashboard UI",
-                     "status": "To Do", "status_category": "new",
-                     "start_date": d(150), "end_date": d(270), "url": "#",
-                     "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
-                     "total_stories": 5},
-                ],
-            },
-            {
-                "key": "INIT-4", "title": "Legacy System Migration",
-                "status": "Done", "status_category": "done",
-                "start_date": d(-150), "end_date": d(-10),
-                "url": "#",
-                "epics": [
-                    {"key": "EPIC-9", "title": "Data extraction",
-                     "status": "Done", "status_category": "done",
-                     "start_date": d(-150), "end_date": d(-80), "url": "#",
-                     "done_stories": 6, "inprogress_stories": 0, "cancelled_stories": 0,
-                     "total_stories": 6},
-                    {"key": "EPIC-10", "title": "Cutover & decommission",
-                     "status": "Done", "status_category": "done",
-                     "start_date": d(-80), "end_date": d(-10), "url": "#",
-                     "done_stories": 4, "inprogress_stories": 0, "cancelled_stories": 0,
-                     "total_stories": 4},
-                ],
-            },
-            {
-                # Initiative with no dates: all 3 epics are in progress but have no
-                # roadmap date fields set.  Each bar should span the full timeline
-                # with a fading left and right edge.
-                "key": "INIT-5", "title": "Continuous Improvement",
-                "status": "In Progress", "status_category": "indeterminate",
-                "start_date": None, "end_date": None,
-                "url": "#",
-                "epics": [
-                    {"key": "EPIC-11", "title": "Performance optimisation",
-                     "status": "In Progress", "status_category": "indeterminate",
-                     "start_date": None, "end_date": None, "url": "#",
-                     "done_stories": 2, "inprogress_stories": 3, "cancelled_stories": 0,
-                     "total_stories": 8},
-                    {"key": "EPIC-12", "title": "Developer experience",
-                     "status": "In Progress", "status_category": "indeterminate",
-                     "start_date": None, "end_date": None, "url": "#",
-                     "done_stories": 0, "inprogress_stories": 2, "cancelled_stories": 0,
-                     "total_stories": 5},
-                    {"key": "EPIC-13", "title": "Documentation refresh",
-                     "status": "In Progress", "status_category": "indeterminate",
-                     "start_date": None, "end_date": None, "url": "#",
-                     "done_stories": 1, "inprogress_stories": 1, "cancelled_stories": 0,
-                     "total_stories": 4},
-                ],
-            },
-        ],
-    }
-
-    return render_template(
-        "index.html",
-        has_config=True,
-        result=True,
-        result_json=result_json,
-        jql=result_json["jql_query"],
-    )
+
+# Demo roadmap with dates given as day offsets from today (None = no date).
+_DEMO_ROADMAP = {
+    "jql_query": "type = Initiative AND project = DEMO",
+    "jira_url": "https://demo.atlassian.net",
+    "timeline_start": -60,
+    "timeline_end": 330,
+    # (from, to) pairs — "from" blocks "to"
+    "initiative_deps": [
+        ["INIT-4", "INIT-1"],   # Legacy migration must finish before Platform Modernisation
+        ["INIT-1", "INIT-3"],   # Platform Modernisation before Analytics Dashboard
+    ],
+    "epic_deps": [
+        ["EPIC-1", "EPIC-2"],   # API Gateway migration before Service mesh rollout
+        ["EPIC-2", "EPIC-3"],   # Service mesh rollout before Observability uplift
+        ["EPIC-4", "EPIC-5"],   # iOS MVP before Android MVP
+    ],
+    "initiatives": [
+        {
+            "key": "INIT-1", "title": "Platform Modernisation",
+            "status": "In Progress", "status_category": "indeterminate",
+            "start_date": -45, "end_date": 180,
+            "url": "#",
+            "epics": [
+                {"key": "EPIC-1", "title": "API Gateway migration",
+                 "status": "In Progress", "status_category": "indeterminate",
+                 "start_date": -45, "end_date": 45, "url": "#",
+                 "done_stories": 5, "inprogress_stories": 2, "cancelled_stories": 0,
+                 "total_stories": 8},
+                {"key": "EPIC-2", "title": "Service mesh rollout",
+                 "status": "To Do", "status_category": "new",
+                 "start_date": 30, "end_date": 120, "url": "#",
+                 "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
+                 "total_stories": 6},
+                {"key": "EPIC-3", "title": "Observability uplift",
+                 "status": "To Do", "status_category": "new",
+                 "start_date": 90, "end_date": 180, "url": "#",
+                 "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
+                 "total_stories": 4},
+            ],
+        },
+        {
+            "key": "INIT-2", "title": "Mobile App Launch",
+            "status": "In Progress", "status_category": "indeterminate",
+            "start_date": -20, "end_date": 150,
+            "url": "#",
+            "epics": [
+                {"key": "EPIC-4", "title": "iOS MVP",
+                 "status": "In Progress", "status_category": "indeterminate",
+                 "start_date": -20, "end_date": 60, "url": "#",
+                 "done_stories": 7, "inprogress_stories": 2, "cancelled_stories": 1,
+                 "total_stories": 10},
+                {"key": "EPIC-5", "title": "Android MVP",
+                 "status": "To Do", "status_category": "new",
+                 "start_date": 50, "end_date": 120, "url": "#",
+                 "done_stories": 2, "inprogress_stories": 0, "cancelled_stories": 0,
+                 "total_stories": 9},
+                {"key": "EPIC-6", "title": "Push notifications",
+                 "status": "To Do", "status_category": "new",
+                 "start_date": 100, "end_date": 150, "url": "#",
+                 "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
+                 "total_stories": 3},
+            ],
+        },
+        {
+            "key": "INIT-3", "title": "Analytics Dashboard",
+            "status": "To Do", "status_category": "new",
+            "start_date": 60, "end_date": 270,
+            "url": "#",
+            "epics": [
+                {"key": "EPIC-7", "title": "Data pipeline",
+                 "status": "To Do", "status_category": "new",
+                 "start_date": 60, "end_date": 150, "url": "#",
+                 "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
+                 "total_stories": 7},
+                {"key": "EPIC-8", "title": "Dashboard UI",
+                 "status": "To Do", "status_category": "new",
+                 "start_date": 150, "end_date": 270, "url": "#",
+                 "done_stories": 0, "inprogress_stories": 0, "cancelled_stories": 0,
+                 "total_stories": 5},
+            ],
+        },
+        {
+            "key": "INIT-4", "title": "Legacy System Migration",
+            "status": "Done", "status_category": "done",
+            "start_date": -150, "end_date": -10,
+            "url": "#",
+            "epics": [
+                {"key": "EPIC-9", "title": "Data extraction",
+                 "status": "Done", "status_category": "done",
+                 "start_date": -150, "end_date": -80, "url": "#",
+                 "done_stories": 6, "inprogress_stories": 0, "cancelled_stories": 0,
+                 "total_stories": 6},
+                {"key": "EPIC-10", "title": "Cutover & decommission",
+                 "status": "Done", "status_category": "done",
+                 "start_date": -80, "end_date": -10, "url": "#",
+                 "done_stories": 4, "inprogress_stories": 0, "cancelled_stories": 0,
+                 "total_stories": 4},
+            ],
+        },
+        {
+            # Initiative with no dates: all 3 epics are in progress but have no
+            # roadmap date fields set.  Each bar should span the full timeline
+            # with a fading left and right edge.
+            "key": "INIT-5", "title": "Continuous Improvement",
+            "status": "In Progress", "status_category": "indeterminate",
+            "start_date": None, "end_date": None,
+            "url": "#",
+            "epics": [
+                {"key": "EPIC-11", "title": "Performance optimisation",
+                 "status": "In Progress", "status_category": "indeterminate",
+                 "start_date": None, "end_date": None, "url": "#",
+                 "done_stories": 2, "inprogress_stories": 3, "cancelled_stories": 0,
+                 "total_stories": 8},
+                {"key": "EPIC-12", "title": "Developer experience",
+                 "status": "In Progress", "status_category": "indeterminate",
+                 "start_date": None, "end_date": None, "url": "#",
+                 "done_stories": 0, "inprogress_stories": 2, "cancelled_stories": 0,
+                 "total_stories": 5},
+                {"key": "EPIC-13", "title": "Documentation refresh",
+                 "status": "In Progress", "status_category": "indeterminate",
+                 "start_date": None, "end_date": None, "url": "#",
+                 "done_stories": 1, "inprogress_stories": 1, "cancelled_stories": 0,
+                 "total_stories": 4},
+            ],
+        },
+    ],
+}
+
+_DEMO_DATE_KEYS = frozenset({"timeline_start", "timeline_end", "start_date", "end_date"})
+
+
+def _demo_result_json(today: date) -> dict:
+    """Build the demo roadmap payload with dates relative to today."""
+
+    def resolve(value):
+        if isinstance(value, dict):
+            return {
+                key: (
+                    (today + timedelta(days=item)).isoformat()
+                    if key in _DEMO_DATE_KEYS and item is not None
+                    else resolve(item)
+                )
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [resolve(item) for item in value]
+        return value
+
+    return resolve(_DEMO_ROADMAP)
 
 
 @bp.route("/api/link-types")
@@ -262,12 +491,20 @@ def api_link_types():
     except (FileNotFoundError, ValueError) as e:
         return jsonify({"error": str(e)}), 503
 
-    try:
-        client = JiraClient(config)
-        link_types = client.list_link_types()
-    except AuthenticationError as e:
-        return jsonify({"error": str(e)}), 401
-    except JiraClientConnectionError as e:
-        return jsonify({"error": str(e)}), 503
+    cache_key = (config.jira_url, config.jira_email)
+    link_types = _link_types_cache.get(cache_key)
+    if link_types is None:
+        try:
+            link_types = get_shared_client(config).list_link_types()
+        except AuthenticationError as e:
+            return jsonify({"error": str(e)}), 401
+        except RateLimitError as e:
+            response = jsonify({"error": str(e)})
+            response.status_code = 429
+            _set_retry_after(response, e.retry_after)
+            return response
+        except JiraClientConnectionError as e:
+            return jsonify({"error": str(e)}), 503
+        _link_types_cache.set(cache_key, link_types)
 
     return jsonify(link_types)
@@ -0,0 +1,115 @@
+"""Shared pytest fixtures."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from jira_roadmap.models import RoadmapEpic, RoadmapInitiative, RoadmapResult
+
+
+@pytest.fixture
+def config_present(request, monkeypatch, roadmap_config):
+    """Report a config file as present to roadmap and web code.
+
+    The web routes load roadmap_config from it. Tests marked ``noconfig`` opt
+    out and patch config_exists themselves.
+    """
+    if request.node.get_closest_marker("noconfig"):
+        return
+    monkeypatch.setattr("jira_roadmap.roadmap.config_exists", lambda: True)
+    monkeypatch.setattr("jira_roadmap.web.routes.config_exists", lambda: True)
+    monkeypatch.setattr("jira_roadmap.web.routes.load_config", lambda: roadmap_config)
+
+
+@pytest.fixture(scope="module")
+def roadmap_config():
+    """Config with JIRA credentials and roadmap date fields."""
+    return SimpleNamespace(
+        jira_url="https://jira.example.com",
+        jira_email="me@example.com",
+        jira_api_token="token",
+        start_date_field="cf_10015",
+        end_date_field="cf_10016",
+        max_workers=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def patch_roadmap_env(roadmap_config):
+    """Make fetch_roadmap load roadmap_config for the rest of the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("jira_roadmap.roadmap.load_config", lambda: roadmap_config)
+        yield
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Flask app shared by all web tests."""
+    from jira_roadmap.web.app import create_app
+
+    app = create_app()
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Test client for the shared app."""
+    return app.test_client()
+
+
+@pytest.fixture(scope="session")
+def golden_result():
+    """Dated roadmap result with one initiative and one epic."""
+    return RoadmapResult(
+        initiatives=[
+            RoadmapInitiative(
+                key="INIT-1",
+                title="Test Initiative",
+                status="In Progress",
+                status_category="indeterminate",
+                start_date=date(2026, 1, 1),
+                end_date=date(2026, 6, 30),
+                epics=[
+                    RoadmapEpic(
+                        key="EPIC-1",
+                        title="Test Epic",
+                        status="To Do",
+                        status_category="new",
+                        start_date=date(2026, 1, 1),
+                        end_date=date(2026, 3, 31),
+                        url="https://jira.example.com/browse/EPIC-1",
+                    ),
+                ],
+                url="https://jira.example.com/browse/INIT-1",
+            ),
+        ],
+        jql_query="type = Initiative",
+        timeline_start=date(2025, 12, 1),
+        timeline_end=date(2026, 8, 1),
+        jira_url="https://jira.example.com",
+    )
+
+
+@pytest.fixture(scope="session")
+def undated_result():
+    """Roadmap result whose only initiative has no dates."""
+    return RoadmapResult(
+        initiatives=[
+            RoadmapInitiative(
+                key="INIT-1",
+                title="No Dates",
+                status="To Do",
+                status_category="new",
+                start_date=None,
+                end_date=None,
+                epics=[],
+                url="https://jira.example.com/browse/INIT-1",
+            ),
+        ],
+        jql_query="type = Initiative",
+        timeline_start=date(2026, 1, 1),
+        timeline_end=date(2026, 12, 31),
+        jira_url="https://jira.example.com",
+    )
@@ -0,0 +1,116 @@
+"""Tests for configuration loading and saving."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from jira_roadmap.config import (
+    Config,
+    clear_config_cache,
+    config_exists,
+    load_config,
+    save_config,
+)
+
+CONFIG_TOML = """\
+[jira]
+url = "https://jira.example.com"
+email = "me@example.com"
+api_token = "token"
+
+[roadmap]
+start_date_field = "cf_10015"
+end_date_field = "cf_10016"
+"""
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Point the config directory at a temporary path with an empty cache."""
+    clear_config_cache()
+    with patch("jira_roadmap.config.get_config_dir", return_value=tmp_path):
+        yield tmp_path
+    clear_config_cache()
+
+
+class TestLoadConfig:
+    """Tests for load_config caching."""
+
+    def test_reuses_parsed_config_when_file_unchanged(self, config_dir):
+        (config_dir / "config.toml").write_text(CONFIG_TOML)
+        first = load_config()
+        with patch("jira_roadmap.config.tomllib.loads") as mock_load:
+            second = load_config()
+        mock_load.assert_not_called()
+        assert second is first
+        assert second.start_date_field == "cf_10015"
+
+    def test_reloads_when_file_changes(self, config_dir):
+        path = config_dir / "config.toml"
+        path.write_text(CONFIG_TOML)
+        load_config()
+
+        path.write_text(CONFIG_TOML.replace("cf_10016", "cf_20000"))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert load_config().end_date_field == "cf_20000"
+
+    def test_save_invalidates_cache(self, config_dir):
+        (config_dir / "config.toml").write_text(CONFIG_TOML)
+        config = load_config()
+
+        save_config(Config(
+            jira_url=config.jira_url,
+            jira_email=config.jira_email,
+            jira_api_token=config.jira_api_token,
+            start_date_field="cf_1",
+            end_date_field="cf_2",
+        ))
+
+        assert load_config().start_date_field == "cf_1"
+
+    def test_raises_when_missing(self, config_dir):
+        with pytest.raises(FileNotFoundError):
+            load_config()
+
+
+class TestConfigExists:
+    """Tests for config_exists caching."""
+
+    def test_reuses_positive_check(self, config_dir):
+        (config_dir / "config.toml").write_text(CONFIG_TOML)
+        assert config_exists()
+        with patch("jira_roadmap.config.Path.exists") as mock_exists:
+            assert config_exists()
+        mock_exists.assert_not_called()
+
+    def test_picks_up_newly_created_config(self, config_dir):
+        assert not config_exists()
+        (config_dir / "config.toml").write_text(CONFIG_TOML)
+        assert config_exists()
+
+
+class TestConfigValidate:
+    """Tests for Config.validate."""
+
+    def test_valid_config_has_no_errors(self):
+        config = Config("https://jira.example.com", "me@example.com", "token")
+        assert config.validate() == ()
+
+    def test_reports_each_invalid_field(self):
+        config = Config("jira.example.com", "@example.com", "")
+        assert config.validate() == (
+            "JIRA URL must start with http:// or https://",
+            "JIRA URL must include a domain",
+            "JIRA email must be a valid email address",
+            "JIRA API token is required",
+        )
+
+    @pytest.mark.parametrize("max_workers", [0, True, False])
+    def test_rejects_non_positive_max_workers(self, max_workers):
+        config = Config(
+            "https://jira.example.com", "me@example.com", "token", max_workers=max_workers
+        )
+        assert config.validate() == ("JIRA max_workers must be a positive integer",)
@@ -0,0 +1,208 @@
+"""Tests for the JIRA API client wrapper."""
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from jira import JIRAError
+
+from jira_roadmap import search_cache
+from jira_roadmap.config import Config
+from jira_roadmap.jira_client import (
+    CachedJiraClient,
+    JiraClient,
+    RateLimitError,
+    get_shared_client,
+)
+from jira_roadmap.search_cache import clear_search_cache, put_cached_search
+
+
+def _make_client(client_cls=JiraClient):
+    """Create a JiraClient with a mocked underlying JIRA connection."""
+    config = Config(
+        jira_url="https://jira.example.com",
+        jira_email="me@example.com",
+        jira_api_token="token",
+    )
+    client = client_cls(config)
+    client._client = MagicMock()
+    return client
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Store the project name cache in a temporary directory."""
+    with patch("jira_roadmap.project_cache.get_config_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+class TestGetProjectNames:
+    """Tests for JiraClient.get_project_names."""
+
+    def test_caches_names_across_clients(self, cache_dir):
+        first = _make_client()
+        first._client.project.return_value.name = "Alpha"
+
+        assert first.get_project_names(["ALPHA"]) == {"ALPHA": "Alpha"}
+
+        second = _make_client()
+        assert second.get_project_names(["ALPHA"]) == {"ALPHA": "Alpha"}
+        second._client.project.assert_not_called()
+
+    def test_refetches_expired_entries(self, cache_dir):
+        client = _make_client()
+        client._client.project.return_value.name = "Alpha"
+        client.get_project_names(["ALPHA"])
+
+        client._client.project.return_value.name = "Alpha Renamed"
+        with patch("jira_roadmap.jira_client.time.time", return_value=time.time() + 86400):
+            assert client.get_project_names(["ALPHA"]) == {"ALPHA": "Alpha Renamed"}
+
+    def test_falls_back_to_key_without_caching(self, cache_dir):
+        client = _make_client()
+        client._client.project.side_effect = Exception("boom")
+        assert client.get_project_names(["NOPE"]) == {"NOPE": "NOPE"}
+
+        client._client.project.side_effect = None
+        client._client.project.return_value.name = "Found"
+        assert client.get_project_names(["NOPE"]) == {"NOPE": "Found"}
+
+
+class TestSearchRoadmapIssues:
+    """Tests for JiraClient.search_roadmap_issues."""
+
+    def test_requests_only_the_given_fields(self):
+        client = _make_client()
+        client._client.enhanced_search_issues.return_value = {"issues": []}
+        client.search_roadmap_issues("key in (EPIC-1)", date_fields=["cf_1"], fields=["status"])
+        kwargs = client._client.enhanced_search_issues.call_args.kwargs
+        assert kwargs["fields"] == ["status", "cf_1"]
+
+    def test_follows_page_tokens(self):
+        client = _make_client()
+        client._client.enhanced_search_issues.side_effect = [
+            {"issues": [{"key": "A-1"}], "nextPageToken": "page-2"},
+            {"issues": [{"key": "A-2"}]},
+        ]
+        issues = client.search_roadmap_issues("project = A", batch_size=1)
+
+        assert [i["key"] for i in issues] == ["A-1", "A-2"]
+        calls = client._client.enhanced_search_issues.call_args_list
+        assert [c.kwargs["nextPageToken"] for c in calls] == [None, "page-2"]
+        assert all(c.kwargs["maxResults"] == 1 for c in calls)
+
+    def test_defaults_to_roadmap_fields(self):
+        client = _make_client()
+        client._client.enhanced_search_issues.return_value = {"issues": []}
+        client.search_roadmap_issues("type = Initiative")
+        kwargs = client._client.enhanced_search_issues.call_args.kwargs
+        assert "issuelinks" in kwargs["fields"]
+
+
+@pytest.fixture
+def search_cache_dir(tmp_path):
+    """Store cached search results in a temporary directory."""
+    with patch("jira_roadmap.search_cache.get_config_dir", return_value=tmp_path):
+        clear_search_cache()
+        yield tmp_path
+        clear_search_cache()
+
+
+class TestCachedJiraClient:
+    """Tests for CachedJiraClient search caching."""
+
+    def _page(self, *keys):
+        return {"issues": [{"key": key, "fields": {"summary": key}} for key in keys]}
+
+    def test_reuses_results_across_clients(self, search_cache_dir):
+        first = _make_client(CachedJiraClient)
+        first._client.enhanced_search_issues.return_value = self._page("INIT-1")
+        issues = first.search_roadmap_issues("type = Initiative", date_fields=["cf_1"])
+
+        with patch("jira_roadmap.search_cache._MEMORY_CACHE", {}):
+            second = _make_client(CachedJiraClient)
+            cached = second.search_roadmap_issues("type = Initiative", date_fields=["cf_1"])
+
+        assert cached == issues
+        second._client.enhanced_search_issues.assert_not_called()
+
+    def test_date_fields_are_part_of_the_key(self, search_cache_dir):
+        client = _make_client(CachedJiraClient)
+        client._client.enhanced_search_issues.return_value = self._page("INIT-1")
+        client.search_roadmap_issues("type = Initiative", date_fields=["cf_1"])
+        client.search_roadmap_issues("type = Initiative", date_fields=[])
+        assert client._client.enhanced_search_issues.call_count == 2
+
+    def test_expired_results_are_refetched(self, search_cache_dir):
+        client = _make_client(CachedJiraClient)
+        client._client.enhanced_search_issues.return_value = self._page("INIT-1")
+        client.search_roadmap_issues("type = Initiative")
+        with patch("jira_roadmap.search_cache.time.time", return_value=time.time() + 3600):
+            client.search_roadmap_issues("type = Initiative")
+        assert client._client.enhanced_search_issues.call_count == 2
+
+    def test_expired_entries_are_pruned(self, search_cache_dir):
+        put_cached_search("old", [{"key": "A-1"}], ttl=0)
+        an_hour_ago = time.time() - 3600
+        os.utime(search_cache_dir / "cache" / "old.json.gz", (an_hour_ago, an_hour_ago))
+        put_cached_search("new", [{"key": "A-2"}])
+
+        assert list(search_cache._MEMORY_CACHE) == ["new"]
+        assert [p.name for p in (search_cache_dir / "cache").iterdir()] == ["new.json.gz"]
+
+
+class TestRateLimiting:
+    """Tests for Retry-After handling in search_roadmap_issues."""
+
+    def _rate_limited(self, retry_after):
+        response = SimpleNamespace(headers={"Retry-After": retry_after})
+        return JIRAError(status_code=429, text="Too Many Requests", response=response)
+
+    def test_waits_for_retry_after_before_retrying(self):
+        client = _make_client()
+        client._client.enhanced_search_issues.side_effect = [
+            self._rate_limited("2"),
+            {"issues": [{"key": "A-1"}]},
+        ]
+        with (
+            patch.object(JiraClient.search_roadmap_issues.retry, "sleep") as mock_sleep,
+            patch("jira_roadmap.jira_client.time.sleep"),
+        ):
+            issues = client.search_roadmap_issues("project = A")
+
+        assert [i["key"] for i in issues] == ["A-1"]
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_raises_after_repeated_rate_limits(self):
+        client = _make_client()
+        client._client.enhanced_search_issues.side_effect = self._rate_limited("0")
+        with pytest.raises(RateLimitError) as exc_info:
+            client.search_roadmap_issues("project = A")
+        assert exc_info.value.retry_after == 0.0
+        assert client._client.enhanced_search_issues.call_count == 3
+
+
+class TestGetSharedClient:
+    """Tests for the process-wide client registry."""
+
+    def _config(self, token="token"):
+        return Config("https://shared.example.com", "me@example.com", token)
+
+    def test_reuses_client_per_identity_and_class(self):
+        with patch("jira_roadmap.jira_client._shared_clients", {}):
+            client = get_shared_client(self._config())
+            assert get_shared_client(self._config()) is client
+            cached = get_shared_client(self._config(), CachedJiraClient)
+            assert isinstance(cached, CachedJiraClient)
+            assert cached is not client
+
+    def test_replaces_client_when_token_changes(self):
+        with patch("jira_roadmap.jira_client._shared_clients", {}) as registry:
+            old = get_shared_client(self._config("old"))
+            old._client = jira = MagicMock()
+            new = get_shared_client(self._config("new"))
+            assert new is not old
+            assert list(registry.values()) == [new]
+            jira.close.assert_not_called()
@@ -1,109 +1,174 @@
 """Tests for roadmap data fetching and processing."""
 
-from datetime import date
-from unittest.mock import MagicMock, patch
+import json
+import re
+import threading
+import time
+from datetime import date, datetime
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
+from flask.json.provider import DefaultJSONProvider
 
 from jira_roadmap.exceptions import (
     ConfigNotFoundError,
     InvalidConfigError,
+    InvalidJqlError,
+    JiraRateLimitError,
     NoIssuesFoundError,
     RoadmapConfigError,
 )
+from jira_roadmap.jira_client import AuthenticationError, JiraClient, RateLimitError
 from jira_roadmap.models import RoadmapEpic, RoadmapInitiative, RoadmapResult
 from jira_roadmap.roadmap import (
+    _add_months,
+    _chunks,
     _get_status_category,
     _parse_date_field,
     fetch_roadmap,
     roadmap_result_to_dict,
+    roadmap_result_to_json,
 )
+from jira_roadmap.web.app import OrjsonProvider
+from jira_roadmap.web.routes import clear_caches
+
+pytestmark = pytest.mark.usefixtures("config_present")
 
 
 class TestParseDateField:
     """Tests for _parse_date_field helper."""
 
-    def test_parses_iso_date(self):
-        fields = {"cf_start": "2026-03-15"}
-        assert _parse_date_field(fields, "cf_start") == date(2026, 3, 15)
-
-    def test_parses_datetime_string(self):
-        fields = {"cf_start": "2026-03-15T10:30:00.000+0000"}
-        assert _parse_date_field(fields, "cf_start") == date(2026, 3, 15)
-
-    def test_returns_none_for_missing_field(self):
-        assert _parse_date_field({}, "cf_start") is None
+    @pytest.mark.parametrize(
+        "fields,expected",
+        [
+            ({"cf_start": "2026-03-15"}, date(2026, 3, 15)),
+            ({"cf_start": "2026-03-15T10:30:00.000+0000"}, date(2026, 3, 15)),
+            ({}, None),
+            ({"cf_start": None}, None),
+            ({"cf_start": "not-a-date"}, None),
+        ],
+        ids=["iso-date", "datetime", "missing", "none", "invalid"],
+    )
+    def test_parse(self, fields, expected):
+        assert _parse_date_field(fields, "cf_start") == expected
 
-    def test_returns_none_for_none_value(self):
-        assert _parse_date_field({"cf_start": None}, "cf_start") is None
 
-    def test_returns_none_for_invalid_value(self):
-        assert _parse_date_field({"cf_start": "not-a-date"}, "cf_start") is None
+def _status(key, name):
+    """Return a status field with the given category."""
+    return {"statusCategory": {"key": key, "name": name}}
 
 
 class TestGetStatusCategory:
     """Tests for _get_status_category helper."""
 
-    def test_returns_new(self):
-        status = {"statusCategory": {"key": "new", "name": "To Do"}}
-        assert _get_status_category(status) == "new"
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (_status("new", "To Do"), "new"),
+            (_status("indeterminate", "In Progress"), "indeterminate"),
+            (_status("done", "Done"), "done"),
+            (_status("unknown", "Done"), "done"),
+            (_status("unknown", "In Progress"), "indeterminate"),
+            (_status("unknown", "Unknown"), "new"),
+            ({}, "new"),
+        ],
+        ids=["new", "indeterminate", "done", "name-done", "name-progress", "default", "empty"],
+    )
+    def test_category(self, status, expected):
+        assert _get_status_category(status) == expected
+
+
+class TestAddMonths:
+    """Tests for _add_months helper."""
+
+    def test_moves_forward_across_year_end(self):
+        assert _add_months(date(2026, 11, 30), 3) == date(2027, 2, 1)
+
+    def test_moves_backward_across_year_start(self):
+        assert _add_months(date(2026, 1, 15), -1) == date(2025, 12, 1)
+
+    def test_zero_months_is_start_of_month(self):
+        assert _add_months(date(2026, 5, 31), 0) == date(2026, 5, 1)
+
+
+class TestChunks:
+    """Tests for _chunks helper."""
+
+    def test_splits_keys_into_bounded_chunks(self):
+        keys = [f"EPIC-{i}" for i in range(5)]
+        assert _chunks(keys, size=2) == [["EPIC-0", "EPIC-1"], ["EPIC-2", "EPIC-3"], ["EPIC-4"]]
 
-    def test_returns_indeterminate(self):
-        status = {"statusCategory": {"key": "indeterminate", "name": "In Progress"}}
-        assert _get_status_category(status) == "indeterminate"
+    def test_returns_no_chunks_for_no_keys(self):
+        assert _chunks([]) == []
 
-    def test_returns_done(self):
-        status = {"statusCategory": {"key": "done", "name": "Done"}}
-        assert _get_status_category(status) == "done"
 
-    def test_falls_back_to_name_done(self):
-        status = {"statusCategory": {"key": "unknown", "name": "Done"}}
-        assert _get_status_category(status) == "done"
+# Tells the initiative, epic and story searches made by fetch_roadmap apart. The epic
+# search also mentions "parent in", but "issueType = Epic" comes first.
+_JQL_RE = re.compile(r"Initiative|issueType = Epic|parent in")
 
-    def test_falls_back_to_name_progress(self):
-        status = {"statusCategory": {"key": "unknown", "name": "In Progress"}}
-        assert _get_status_category(status) == "indeterminate"
 
-    def test_defaults_to_new(self):
-        status = {"statusCategory": {"key": "unknown", "name": "Unknown"}}
-        assert _get_status_category(status) == "new"
+def _route_by_jql(mapping):
+    """Build a search side effect returning mapping[kind] for the JQL's query kind.
 
-    def test_handles_empty_status(self):
-        assert _get_status_category({}) == "new"
+    Kinds are the _JQL_RE alternatives; searches with no mapped kind return no issues.
+    """
+    def search(jql, **kwargs):
+        match = _JQL_RE.search(jql)
+        return mapping.get(match[0] if match else "", [])
+    return search
 
 
-def _make_config(start_field="cf_10015", end_field="cf_10016"):
-    """Create a mock config with roadmap fields."""
-    config = MagicMock()
-    config.start_date_field = start_field
-    config.end_date_field = end_field
-    config.jira_url = "https://jira.example.com"
-    return config
+class _StubJiraClient:
+    """JiraClient stand-in answering searches from a _route_by_jql side effect."""
+
+    def __init__(self, search):
+        self._search = search
+        self.searched = []
+
+    def search_roadmap_issues(self, jql, **kwargs):
+        self.searched.append(jql)
+        return self._search(jql, **kwargs)
+
+    def get_project_names(self, project_keys):
+        return {}
+
+
+# Read-only sub-structures shared by the raw issue builders below.
+_EPIC_TYPE = MappingProxyType({"name": "Epic"})
+_INITIATIVE_TYPE = MappingProxyType({"name": "Initiative"})
+_IN_PROGRESS_STATUS = MappingProxyType({
+    "name": "In Progress",
+    "statusCategory": MappingProxyType({"key": "indeterminate", "name": "In Progress"}),
+})
+_NEW_STATUS = MappingProxyType({
+    "name": "To Do",
+    "statusCategory": MappingProxyType({"key": "new", "name": "To Do"}),
+})
+
+
+def _epic_link(link_type, epic_key, summary):
+    """Build an outward issuelinks entry pointing at an epic."""
+    return {
+        "type": {"name": link_type},
+        "outwardIssue": {
+            "key": epic_key,
+            "fields": {"issuetype": _EPIC_TYPE, "summary": summary},
+        },
+    }
 
 
 def _make_initiative_issue(key, summary, epic_links=None):
     """Build a raw initiative issue dict with optional epic links."""
-    links = []
-    for epic_key in (epic_links or []):
-        links.append({
-            "type": {"name": "Relates"},
-            "outwardIssue": {
-                "key": epic_key,
-                "fields": {
-                    "issuetype": {"name": "Epic"},
-                    "summary": f"Epic {epic_key}",
-                },
-            },
-        })
+    links = [
+        _epic_link("Relates", epic_key, f"Epic {epic_key}") for epic_key in (epic_links or [])
+    ]
     return {
         "key": key,
         "fields": {
             "summary": summary,
-            "issuetype": {"name": "Initiative"},
-            "status": {
-                "name": "In Progress",
-                "statusCategory": {"key": "indeterminate", "name": "In Progress"},
-            },
+            "issuetype": _INITIATIVE_TYPE,
+            "status": _IN_PROGRESS_STATUS,
             "issuelinks": links,
         },
     }
@@ -115,11 +180,8 @@ def _make_epic_issue(key, summary, start_date=None, end_date=None):
         "key": key,
         "fields": {
             "summary": summary,
-            "issuetype": {"name": "Epic"},
-            "status": {
-                "name": "To Do",
-                "statusCategory": {"key": "new", "name": "To Do"},
-            },
+            "issuetype": _EPIC_TYPE,
+            "status": _NEW_STATUS,
             "issuelinks": [],
             "cf_10015": start_date,
             "cf_10016": end_date,
@@ -133,11 +195,8 @@ def _make_inprogress_epic_issue(key, summary):
         "key": key,
         "fields": {
             "summary": summary,
-            "issuetype": {"name": "Epic"},
-            "status": {
-                "name": "In Progress",
-                "statusCategory": {"key": "indeterminate", "name": "In Progress"},
-            },
+            "issuetype": _EPIC_TYPE,
+            "status": _IN_PROGRESS_STATUS,
             "issuelinks": [],
             "cf_10015": None,
             "cf_10016": None,
@@ -145,265 +204,220 @@ def _make_inprogress_epic_issue(key, summary):
     }
 
 
+def _with_fields(issue, **fields):
+    """Return a copy of issue with the given fields added or replaced."""
+    return {**issue, "fields": {**issue["fields"], **fields}}
+
+
 class TestFetchRoadmap:
     """Tests for fetch_roadmap function."""
 
-    @patch("jira_roadmap.roadmap.config_exists", return_value=False)
-    def test_raises_when_no_config(self, mock_exists):
+    @pytest.fixture(autouse=True)
+    def _mocks(self, patch_roadmap_env, monkeypatch):
+        """Load roadmap_config for every test and keep monkeypatch for _serve."""
+        self.monkeypatch = monkeypatch
+
+    def _serve(self, routes):
+        """Make fetch_roadmap search through a _StubJiraClient answering from routes."""
+        client = _StubJiraClient(_route_by_jql(routes))
+        self.monkeypatch.setattr(
+            "jira_roadmap.roadmap.get_shared_client", lambda config, client_cls=None: client
+        )
+        return client
+
+    @pytest.mark.noconfig
+    def test_raises_when_no_config(self):
+        self.monkeypatch.setattr("jira_roadmap.roadmap.config_exists", lambda: False)
         with pytest.raises(ConfigNotFoundError):
             fetch_roadmap("type = Initiative")
 
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_raises_when_invalid_config(self, mock_exists, mock_load):
-        mock_load.side_effect = ValueError("bad config")
+    def test_raises_when_config_removed_after_check(self):
+        def load_config():
+            raise FileNotFoundError("config.toml")
+
+        self.monkeypatch.setattr("jira_roadmap.roadmap.load_config", load_config)
+        with pytest.raises(ConfigNotFoundError):
+            fetch_roadmap("type = Initiative")
+
+    def test_raises_when_invalid_config(self):
+        def load_config():
+            raise ValueError("bad config")
+
+        self.monkeypatch.setattr("jira_roadmap.roadmap.load_config", load_config)
         with pytest.raises(InvalidConfigError):
             fetch_roadmap("type = Initiative")
 
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_raises_when_roadmap_fields_missing(self, mock_exists, mock_load):
-        config = MagicMock()
-        config.start_date_field = None
-        config.end_date_field = None
-        mock_load.return_value = config
+    def test_raises_when_roadmap_fields_missing(self):
+        config = SimpleNamespace(start_date_field=None, end_date_field=None)
+        self.monkeypatch.setattr("jira_roadmap.roadmap.load_config", lambda: config)
         with pytest.raises(RoadmapConfigError, match="not configured"):
             fetch_roadmap("type = Initiative")
 
-    @patch("jira_roadmap.roadmap.JiraClient")
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_raises_when_no_issues(self, mock_exists, mock_load, mock_jira_cls):
-        mock_load.return_value = _make_config()
-        mock_client = MagicMock()
-        mock_client.search_roadmap_issues.return_value = []
-        mock_jira_cls.return_value = mock_client
+    def test_raises_when_no_issues(self):
+        self._serve({})
 
         with pytest.raises(NoIssuesFoundError):
             fetch_roadmap("type = Initiative")
 
-    @patch("jira_roadmap.roadmap.JiraClient")
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_builds_initiatives_with_epics(self, mock_exists, mock_load, mock_jira_cls):
-        mock_load.return_value = _make_config()
-        mock_client = MagicMock()
-
-        initiatives = [
+    @pytest.mark.parametrize("init_issue,epics,link_types,expected_keys,expected_dates", [
+        pytest.param(
             _make_initiative_issue("INIT-1", "Initiative One", ["EPIC-1", "EPIC-2"]),
-        ]
-        epics = [
-            _make_epic_issue("EPIC-1", "Epic One", "2026-01-01", "2026-03-31"),
-            _make_epic_issue("EPIC-2", "Epic Two", "2026-02-15", "2026-06-30"),
-        ]
-
-        def search_side_effect(jql, **kwargs):
-            if "INIT" in jql or "Initiative" in jql:
-                return initiatives
-            return epics
-
-        mock_client.search_roadmap_issues.side_effect = search_side_effect
-        mock_client.get_project_names.return_value = {}
-        mock_jira_cls.return_value = mock_client
+            [
+                _make_epic_issue("EPIC-1", "Epic One", "2026-01-01", "2026-03-31"),
+                _make_epic_issue("EPIC-2", "Epic Two", "2026-02-15", "2026-06-30"),
+            ],
+            None,
+            {"EPIC-1", "EPIC-2"},
+            (date(2026, 1, 1), date(2026, 6, 30)),
+            id="linked_epics",
+        ),
+        pytest.param(
+            # Only EPIC-1 via "Relates" link, not EPIC-2 via "Blocks"
+            _with_fields(
+                _make_initiative_issue("INIT-1", "Test", ["EPIC-1", "EPIC-2"]),
+                issuelinks=[
+                    _epic_link("Relates", "EPIC-1", "E1"),
+                    _epic_link("Blocks", "EPIC-2", "E2"),
+                ],
+            ),
+            [
+                _make_epic_issue("EPIC-1", "E1", "2026-01-01", "2026-03-31"),
+                _make_epic_issue("EPIC-2", "E2", "2026-02-15", "2026-06-30"),
+            ],
+            ["Relates"],
+            {"EPIC-1"},
+            (date(2026, 1, 1), date(2026, 3, 31)),
+            id="link_filter",
+        ),
+        pytest.param(
+            # One linked epic and one child epic (subtask hierarchy)
+            _with_fields(
+                _make_initiative_issue("INIT-1", "Test", ["EPIC-1"]),
+                subtasks=[
+                    {"key": "EPIC-2", "fields": {"issuetype": _EPIC_TYPE, "summary": "Child"}},
+                    {"key": "STORY-1", "fields": {"issuetype": {"name": "Story"}}},
+                ],
+            ),
+            [
+                _make_epic_issue("EPIC-1", "Linked Epic", "2026-01-01", "2026-03-31"),
+                _make_epic_issue("EPIC-2", "Child Epic", "2026-04-01", "2026-06-30"),
+            ],
+            None,
+            {"EPIC-1", "EPIC-2"},
+            (date(2026, 1, 1), date(2026, 6, 30)),
+            id="child_subtasks",
+        ),
+        pytest.param(
+            # No issuelinks and no subtasks — the epic is a child via the parent field
+            _with_fields(_make_initiative_issue("INIT-1", "Test"), subtasks=[]),
+            [
+                _with_fields(
+                    _make_epic_issue("EPIC-1", "Child via Parent", "2026-03-01", "2026-06-30"),
+                    parent={"key": "INIT-1"},
+                ),
+            ],
+            None,
+            {"EPIC-1"},
+            (date(2026, 3, 1), date(2026, 6, 30)),
+            id="parent_field",
+        ),
+    ])
+    def test_collects_epics(self, init_issue, epics, link_types, expected_keys, expected_dates):
+        self._serve({
+            "Initiative": [init_issue],
+            "issueType = Epic": epics,
+        })
 
-        result = fetch_roadmap("type = Initiative")
+        result = fetch_roadmap("type = Initiative", link_types=link_types)
 
         assert len(result.initiatives) == 1
         init = result.initiatives[0]
         assert init.key == "INIT-1"
-        assert len(init.epics) == 2
-        assert init.start_date == date(2026, 1, 1)
-        assert init.end_date == date(2026, 6, 30)
         assert init.status_category == "indeterminate"
-
-    @patch("jira_roadmap.roadmap.JiraClient")
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_filters_by_link_type(self, mock_exists, mock_load, mock_jira_cls):
-        mock_load.return_value = _make_config()
-        mock_client = MagicMock()
-
-        # Initiative with Relates and Blocks links
-        init_issue = {
-            "key": "INIT-1",
-            "fields": {
-                "summary": "Test",
-                "issuetype": {"name": "Initiative"},
-                "status": {
-                    "name": "To Do",
-                    "statusCategory": {"key": "new", "name": "To Do"},
-                },
-                "issuelinks": [
-                    {
-                        "type": {"name": "Relates"},
-                        "outwardIssue": {
-                            "key": "EPIC-1",
-                            "fields": {"issuetype": {"name": "Epic"}, "summary": "E1"},
-                        },
-                    },
-                    {
-                        "type": {"name": "Blocks"},
-                        "outwardIssue": {
-                            "key": "EPIC-2",
-                            "fields": {"issuetype": {"name": "Epic"}, "summary": "E2"},
-                        },
-                    },
-                ],
-            },
-        }
-
+        assert {e.key for e in init.epics} == expected_keys
+        assert (init.start_date, init.end_date) == expected_dates
+
+    def test_lists_epic_once_when_linked_and_child(self):
+        # EPIC-1 is linked twice and is also a child work item of the initiative
+        init_issue = _make_initiative_issue("INIT-1", "Test", ["EPIC-1", "EPIC-1"])
+        init_issue["fields"]["subtasks"] = [
+            {"key": "EPIC-1", "fields": {"issuetype": _EPIC_TYPE, "summary": "E1"}},
+        ]
         epic1 = _make_epic_issue("EPIC-1", "E1", "2026-01-01", "2026-03-31")
+        epic1["fields"]["parent"] = {"key": "INIT-1"}
 
-        def search_side_effect(jql, **kwargs):
-            if "Initiative" in jql:
-                return [init_issue]
-            # Only EPIC-1 should be fetched
-            return [epic1]
+        self._serve({
+            "Initiative": [init_issue],
+            "issueType = Epic": [epic1],
+        })
 
-        mock_client.search_roadmap_issues.side_effect = search_side_effect
-        mock_client.get_project_names.return_value = {}
-        mock_jira_cls.return_value = mock_client
+        result = fetch_roadmap("type = Initiative")
 
-        result = fetch_roadmap("type = Initiative", link_types=["Relates"])
+        assert [e.key for e in result.initiatives[0].epics] == ["EPIC-1"]
 
-        init = result.initiatives[0]
-        # Only EPIC-1 via "Relates" link, not EPIC-2 via "Blocks"
-        assert len(init.epics) == 1
-        assert init.epics[0].key == "EPIC-1"
-
-    @patch("jira_roadmap.roadmap.JiraClient")
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_collects_epics_from_child_work_items(self, mock_exists, mock_load, mock_jira_cls):
-        mock_load.return_value = _make_config()
-        mock_client = MagicMock()
-
-        # Initiative with one linked epic and one child epic (subtask hierarchy)
-        init_issue = {
-            "key": "INIT-1",
-            "fields": {
-                "summary": "Test",
-                "issuetype": {"name": "Initiative"},
-                "status": {
-                    "name": "In Progress",
-                    "statusCategory": {"key": "indeterminate", "name": "In Progress"},
-                },
-                "issuelinks": [
-                    {
-                        "type": {"name": "Relates"},
-                        "outwardIssue": {
-                            "key": "EPIC-1",
-                            "fields": {"issuetype": {"name": "Epic"}, "summary": "Linked Epic"},
-                        },
-                    },
-                ],
-                "subtasks": [
-                    {
-                        "key": "EPIC-2",
-                        "fields": {"issuetype": {"name": "Epic"}, "summary": "Child Epic"},
-                    },
-                    {
-                        "key": "STORY-1",
-                        "fields": {"issuetype": {"name": "Story"}, "summary": "Not an epic"},
-                    },
-                ],
-            },
-        }
+    def test_fetches_linked_and_child_epics_in_one_search(self):
+        initiative = _make_initiative_issue("INIT-1", "Initiative", ["EPIC-1"])
+        linked_epic = _make_epic_issue("EPIC-1", "Linked", "2026-01-01", "2026-03-31")
+        child_epic = _make_epic_issue("EPIC-2", "Child", "2026-04-01", "2026-06-30")
+        child_epic["fields"]["parent"] = {"key": "INIT-1"}
 
-        epic1 = _make_epic_issue("EPIC-1", "Linked Epic", "2026-01-01", "2026-03-31")
-        epic2 = _make_epic_issue("EPIC-2", "Child Epic", "2026-04-01", "2026-06-30")
+        client = self._serve({
+            "Initiative": [initiative],
+            "issueType = Epic": [linked_epic, child_epic],
+        })
 
-        def search_side_effect(jql, **kwargs):
-            if "Initiative" in jql:
-                return [init_issue]
-            return [epic1, epic2]
+        result = fetch_roadmap("type = Initiative")
 
-        mock_client.search_roadmap_issues.side_effect = search_side_effect
-        mock_client.get_project_names.return_value = {}
-        mock_jira_cls.return_value = mock_client
+        searched = client.searched
+        epic_searches = [jql for jql in searched if "issueType = Epic" in jql]
+        assert epic_searches == ["(issueType = Epic AND parent in (INIT-1)) OR key in (EPIC-1)"]
+        # Stories of the linked epic are fetched up front, the child epic's afterwards
+        assert "parent in (EPIC-1)" in searched
+        assert searched[-1] == "parent in (EPIC-2)"
+        assert [e.key for e in result.initiatives[0].epics] == ["EPIC-1", "EPIC-2"]
 
-        result = fetch_roadmap("type = Initiative")
+    def test_counts_child_stories_by_status(self):
+        initiative = _make_initiative_issue("INIT-1", "Initiative", ["EPIC-1", "EPIC-2"])
+        epics = [
+            _make_epic_issue("EPIC-1", "Epic One", "2026-01-01", "2026-03-31"),
+            _make_epic_issue("EPIC-2", "Epic Two", "2026-02-01", "2026-04-30"),
+        ]
 
-        init = result.initiatives[0]
-        assert len(init.epics) == 2
-        epic_keys = {e.key for e in init.epics}
-        assert epic_keys == {"EPIC-1", "EPIC-2"}
-        assert init.start_date == date(2026, 1, 1)
-        assert init.end_date == date(2026, 6, 30)
-
-    @patch("jira_roadmap.roadmap.JiraClient")
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_collects_epics_via_parent_field(self, mock_exists, mock_load, mock_jira_cls):
-        mock_load.return_value = _make_config()
-        mock_client = MagicMock()
-
-        # Initiative with no issuelinks and no subtasks — epics are children via parent field
-        init_issue = {
-            "key": "INIT-1",
-            "fields": {
-                "summary": "Test",
-                "issuetype": {"name": "Initiative"},
-                "status": {
-                    "name": "In Progress",
-                    "statusCategory": {"key": "indeterminate", "name": "In Progress"},
-                },
-                "issuelinks": [],
-                "subtasks": [],
-            },
-        }
-
-        # Returned by the parent-field JQL query
-        child_epic_raw = {
-            "key": "EPIC-1",
-            "fields": {
-                "summary": "Child Epic via Parent",
-                "issuetype": {"name": "Epic"},
-                "status": {
-                    "name": "To Do",
-                    "statusCategory": {"key": "new", "name": "To Do"},
+        def story(key, parent_key, status_name, category_key):
+            return {
+                "key": key,
+                "fields": {
+                    "parent": {"key": parent_key},
+                    "status": {"name": status_name, "statusCategory": {"key": category_key}},
                 },
-                "issuelinks": [],
-                "subtasks": [],
-                "parent": {"key": "INIT-1"},
-                "cf_10015": "2026-03-01",
-                "cf_10016": "2026-06-30",
-            },
-        }
-
-        epic_detail = _make_epic_issue("EPIC-1", "Child Epic via Parent", "2026-03-01", "2026-06-30")
-
-        def search_side_effect(jql, **kwargs):
-            if "Initiative" in jql:
-                return [init_issue]
-            if "parent in" in jql:
-                return [child_epic_raw]
-            return [epic_detail]
-
-        mock_client.search_roadmap_issues.side_effect = search_side_effect
-        mock_client.get_project_names.return_value = {}
-        mock_jira_cls.return_value = mock_client
+            }
+
+        stories = [
+            story("S-1", "EPIC-1", "Done", "done"),
+            story("S-2", "EPIC-1", "Done", "done"),
+            story("S-3", "EPIC-1", "Cancelled", "done"),
+            story("S-4", "EPIC-1", "In Progress", "indeterminate"),
+            story("S-5", "EPIC-1", "To Do", "new"),
+            story("S-6", "OTHER-1", "Done", "done"),
+        ]
+
+        self._serve({
+            "Initiative": [initiative],
+            "issueType = Epic": epics,
+            "parent in": stories,
+        })
 
         result = fetch_roadmap("type = Initiative")
 
-        init = result.initiatives[0]
-        assert len(init.epics) == 1
-        assert init.epics[0].key == "EPIC-1"
-        assert init.start_date is not None
-        assert init.end_date is not None
-
-    @patch("jira_roadmap.roadmap.JiraClient")
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_initiative_without_epics(self, mock_exists, mock_load, mock_jira_cls):
-        mock_load.return_value = _make_config()
-        mock_client = MagicMock()
+        epic1, epic2 = result.initiatives[0].epics
+        assert (epic1.done_stories, epic1.cancelled_stories) == (2, 1)
+        assert (epic1.inprogress_stories, epic1.total_stories) == (1, 5)
+        assert epic2.total_stories == 0
 
+    def test_initiative_without_epics(self):
         initiatives = [_make_initiative_issue("INIT-1", "Lonely Initiative", [])]
 
-        mock_client.search_roadmap_issues.return_value = initiatives
-        mock_client.get_project_names.return_value = {}
-        mock_jira_cls.return_value = mock_client
+        self._serve({"Initiative": initiatives})
 
         result = fetch_roadmap("type = Initiative")
         init = result.initiatives[0]
@@ -411,154 +425,73 @@ class TestFetchRoadmap:
         assert init.start_date is None
         assert init.end_date is None
 
-    @patch("jira_roadmap.roadmap.JiraClient")
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_inprogress_epics_without_dates_have_null_dates(
-        self, mock_exists, mock_load, mock_jira_cls
-    ):
-        """In-progress epics with no roadmap dates should produce null start/end
-        in the result.  The JS renderer turns these into full-timeline fading bars.
+    @pytest.mark.parametrize("epics,all_undated", [
+        pytest.param(
+            [
+                _make_inprogress_epic_issue("EPIC-1", "Undated Epic 1"),
+                _make_inprogress_epic_issue("EPIC-2", "Undated Epic 2"),
+                _make_inprogress_epic_issue("EPIC-3", "Undated Epic 3"),
+            ],
+            True,
+            id="all_undated",
+        ),
+        pytest.param(
+            [
+                _make_epic_issue("EPIC-1", "Dated Epic", "2026-01-01", "2026-06-30"),
+                _make_epic_issue("EPIC-2", "No-end Epic", "2026-03-01", None),
+                _make_inprogress_epic_issue("EPIC-3", "Fully Undated Epic"),
+            ],
+            False,
+            id="some_undated",
+        ),
+    ])
+    def test_initiative_has_no_dates_when_any_epic_lacks_dates(self, epics, all_undated):
+        """If any epic is missing a start or end date, the initiative boundary
+        on that side must be None — we can't claim a definite range when some
+        epics are unscheduled.  In-progress epics with no roadmap dates keep
+        null start/end, which the JS renderer turns into full-timeline fading bars.
         """
-        mock_load.return_value = _make_config()
-        mock_client = MagicMock()
-
-        initiative = _make_initiative_issue(
-            "INIT-1", "Undated Initiative", ["EPIC-1", "EPIC-2", "EPIC-3"]
-        )
-        initiative["fields"]["status"] = {
-            "name": "In Progress",
-            "statusCategory": {"key": "indeterminate", "name": "In Progress"},
-        }
-
-        epics = [
-            _make_inprogress_epic_issue("EPIC-1", "Undated Epic 1"),
-            _make_inprogress_epic_issue("EPIC-2", "Undated Epic 2"),
-            _make_inprogress_epic_issue("EPIC-3", "Undated Epic 3"),
-        ]
-
-        def search_side_effect(jql, **kwargs):
-            if "Initiative" in jql:
-                return [initiative]
-            if "parent in" in jql and "INIT" in jql:
-                return []  # no child epics via parent hierarchy
-            if "key in" in jql:
-                return epics  # bulk epic fetch
-            return []  # no stories
-
-        mock_client.search_roadmap_issues.side_effect = search_side_effect
-        mock_client.get_project_names.return_value = {}
-        mock_jira_cls.return_value = mock_client
+        epic_keys = [epic["key"] for epic in epics]
+        self._serve({
+            "Initiative": [_make_initiative_issue("INIT-1", "Initiative", epic_keys)],
+            "issueType = Epic": epics,
+        })
 
         result = fetch_roadmap("type = Initiative")
 
         assert len(result.initiatives) == 1
         init = result.initiatives[0]
         assert init.status_category == "indeterminate"
-        assert init.start_date is None, "initiative start_date must be None when all epics have no dates"
-        assert init.end_date is None, "initiative end_date must be None when all epics have no dates"
-
-        assert len(init.epics) == 3
-        for epic in init.epics:
-            assert epic.status_category == "indeterminate"
-            assert epic.start_date is None, f"{epic.key} start_date must be None"
-            assert epic.end_date is None, f"{epic.key} end_date must be None"
+        assert init.start_date is None, "start must be None because EPIC-3 has no start"
+        assert init.end_date is None, "end must be None because EPIC-3 has no end"
 
         # Serialised output must also carry null dates so the JS renderer
         # can apply the full-timeline fading bar treatment.
-        d = roadmap_result_to_dict(result)
-        d_init = d["initiatives"][0]
+        d_init = roadmap_result_to_dict(result)["initiatives"][0]
         assert d_init["start_date"] is None
         assert d_init["end_date"] is None
-        for d_epic in d_init["epics"]:
-            assert d_epic["start_date"] is None
-            assert d_epic["end_date"] is None
 
+        if all_undated:
+            assert len(init.epics) == 3
+            for epic, d_epic in zip(init.epics, d_init["epics"]):
+                assert epic.status_category == "indeterminate"
+                assert epic.start_date is None, f"{epic.key} start_date must be None"
+                assert epic.end_date is None, f"{epic.key} end_date must be None"
+                assert d_epic["start_date"] is None
+                assert d_epic["end_date"] is None
 
-    @patch("jira_roadmap.roadmap.JiraClient")
-    @patch("jira_roadmap.roadmap.load_config")
-    @patch("jira_roadmap.roadmap.config_exists", return_value=True)
-    def test_initiative_has_no_dates_when_any_epic_lacks_dates(
-        self, mock_exists, mock_load, mock_jira_cls
-    ):
-        """If any epic is missing a start or end date, the initiative boundary
-        on that side must be None — we can't claim a definite range when some
-        epics are unscheduled.
-        """
-        mock_load.return_value = _make_config()
-        mock_client = MagicMock()
 
-        initiative = _make_initiative_issue(
-            "INIT-1", "Mixed Initiative", ["EPIC-1", "EPIC-2", "EPIC-3"]
-        )
-        initiative["fields"]["status"] = {
-            "name": "In Progress",
-            "statusCategory": {"key": "indeterminate", "name": "In Progress"},
-        }
-
-        epics = [
-            _make_epic_issue("EPIC-1", "Dated Epic",     "2026-01-01", "2026-06-30"),
-            _make_epic_issue("EPIC-2", "No-end Epic",    "2026-03-01", None),
-            _make_inprogress_epic_issue("EPIC-3", "Fully Undated Epic"),
-        ]
-
-        def search_side_effect(jql, **kwargs):
-            if "Initiative" in jql:
-                return [initiative]
-            if "parent in" in jql and "INIT" in jql:
-                return []
-            if "key in" in jql:
-                return epics
-            return []
-
-        mock_client.search_roadmap_issues.side_effect = search_side_effect
-        mock_client.get_project_names.return_value = {}
-        mock_jira_cls.return_value = mock_client
-
-        result = fetch_roadmap("type = Initiative")
-        init = result.initiatives[0]
-
-        # EPIC-2 has no end, EPIC-3 has no start or end — initiative must
-        # expose None on both sides.
-        assert init.start_date is None, "start must be None because EPIC-3 has no start"
-        assert init.end_date is None, "end must be None because EPIC-2 and EPIC-3 have no end"
+@pytest.fixture(scope="module")
+def golden_dict(golden_result):
+    """golden_result serialized once for the whole module."""
+    return roadmap_result_to_dict(golden_result)
 
 
 class TestRoadmapResultToDict:
     """Tests for roadmap_result_to_dict serializer."""
 
-    def test_serializes_result(self):
-        result = RoadmapResult(
-            initiatives=[
-                RoadmapInitiative(
-                    key="INIT-1",
-                    title="Test Initiative",
-                    status="In Progress",
-                    status_category="indeterminate",
-                    start_date=date(2026, 1, 1),
-                    end_date=date(2026, 6, 30),
-                    epics=[
-                        RoadmapEpic(
-                            key="EPIC-1",
-                            title="Test Epic",
-                            status="To Do",
-                            status_category="new",
-                            start_date=date(2026, 1, 1),
-                            end_date=date(2026, 3, 31),
-                            url="https://jira.example.com/browse/EPIC-1",
-                        ),
-                    ],
-                    url="https://jira.example.com/browse/INIT-1",
-                ),
-            ],
-            jql_query="type = Initiative",
-            timeline_start=date(2025, 12, 1),
-            timeline_end=date(2026, 8, 1),
-            jira_url="https://jira.example.com",
-        )
-
-        d = roadmap_result_to_dict(result)
-
+    def test_serializes_result(self, golden_dict):
+        d = golden_dict
         assert d["timeline_start"] == "2025-12-01"
         assert d["timeline_end"] == "2026-08-01"
         assert len(d["initiatives"]) == 1
@@ -569,71 +502,344 @@ class TestRoadmapResultToDict:
         assert init["epics"][0]["key"] == "EPIC-1"
         assert init["epics"][0]["start_date"] == "2026-01-01"
 
-    def test_handles_none_dates(self):
-        result = RoadmapResult(
+    def test_handles_none_dates(self, undated_result):
+        d = roadmap_result_to_dict(undated_result)
+        init = d["initiatives"][0]
+        assert init["start_date"] is None
+        assert init["end_date"] is None
+
+
+class TestRoadmapResultToJson:
+    """Tests for roadmap_result_to_json serializer."""
+
+    def _make_result(self):
+        epic = RoadmapEpic(
+            key="EPIC-1",
+            title="Test Epic",
+            status="To Do",
+            status_category="new",
+            start_date=date(2026, 1, 1),
+            end_date=None,
+            url="https://jira.example.com/browse/EPIC-1",
+            total_stories=3,
+        )
+        return RoadmapResult(
             initiatives=[
                 RoadmapInitiative(
                     key="INIT-1",
-                    title="No Dates",
-                    status="To Do",
-                    status_category="new",
-                    start_date=None,
+                    title="Test Initiative",
+                    status="In Progress",
+                    status_category="indeterminate",
+                    start_date=date(2026, 1, 1),
                     end_date=None,
-                    epics=[],
+                    epics=[epic],
                     url="https://jira.example.com/browse/INIT-1",
                 ),
             ],
             jql_query="type = Initiative",
-            timeline_start=date(2026, 1, 1),
-            timeline_end=date(2026, 12, 31),
+            timeline_start=date(2025, 12, 1),
+            timeline_end=date(2026, 8, 1),
             jira_url="https://jira.example.com",
+            initiative_deps=[("INIT-1", "INIT-2")],
+            project_names={"INIT": "Initiatives"},
         )
 
-        d = roadmap_result_to_dict(result)
-        init = d["initiatives"][0]
-        assert init["start_date"] is None
-        assert init["end_date"] is None
+    def test_matches_dict_serialization(self):
+        result = self._make_result()
+        assert json.loads(roadmap_result_to_json(result)) == roadmap_result_to_dict(result)
+
+    def test_falls_back_to_stdlib_json(self, monkeypatch):
+        monkeypatch.setattr("jira_roadmap.roadmap.orjson", None)
+        result = self._make_result()
+        assert json.loads(roadmap_result_to_json(result)) == roadmap_result_to_dict(result)
 
 
 class TestRoadmapRoutes:
     """Tests for roadmap HTTP route handlers."""
 
-    def setup_method(self):
-        from jira_roadmap.web.app import create_app
-        self.app = create_app()
-        self.app.config["TESTING"] = True
-        self.client = self.app.test_client()
+    @pytest.fixture(autouse=True)
+    def _client(self, app, client):
+        """Give each test a fresh client and empty web caches."""
+        clear_caches()
+        self.app = app
+        self.client = client
+
+    @pytest.fixture
+    def mock_fetch(self, monkeypatch):
+        """Replace fetch_roadmap in the routes; it returns an empty roadmap."""
+        mock = MagicMock(return_value=SimpleNamespace(initiatives=[]))
+        monkeypatch.setattr("jira_roadmap.web.routes.fetch_roadmap", mock)
+        return mock
+
+    @pytest.fixture
+    def mock_to_json(self, monkeypatch):
+        """Replace roadmap_result_to_json in the routes; it returns an empty object."""
+        mock = MagicMock(return_value=b"{}")
+        monkeypatch.setattr("jira_roadmap.web.routes.roadmap_result_to_json", mock)
+        return mock
+
+    @pytest.fixture
+    def jira_client(self, monkeypatch):
+        """Serve the routes' shared JIRA client from a mock."""
+        client = MagicMock(spec_set=JiraClient)
+        monkeypatch.setattr(
+            "jira_roadmap.web.routes.get_shared_client", lambda config, client_cls=None: client
+        )
+        return client
+
+    def _job_id(self, resp):
+        """Extract the background job id from a roadmap POST's page."""
+        return re.search(rb"/api/roadmap/([0-9a-f]+)", resp.data).group(1).decode()
+
+    def _wait_for_job(self, resp):
+        """Poll the background fetch started by a roadmap POST until it finishes."""
+        job_id = self._job_id(resp)
+        for _ in range(500):
+            job = self.client.get(f"/api/roadmap/{job_id}")
+            if job.status_code != 202:
+                return job
+            time.sleep(0.01)
+        raise AssertionError("roadmap job did not finish")
+
+    def test_index_template_is_compiled_at_startup(self):
+        assert any(name == "index.html" for _, name in self.app.jinja_env.cache.keys())
+
+    def test_each_route_is_registered_once(self):
+        rules = [(rule.rule, frozenset(rule.methods)) for rule in self.app.url_map.iter_rules()]
+        assert len(rules) == len(set(rules))
+
+    def test_serves_static_files(self):
+        resp = self.client.get("/static/js/roadmap.js")
+        assert resp.status_code == 200
+        resp.close()
+
+    def test_json_provider_uses_orjson_when_installed(self):
+        pytest.importorskip("orjson")
+        assert isinstance(self.app.json, OrjsonProvider)
+        assert self.app.json.dumps({"b": 1, "a": [None]}) == '{"a":[null],"b":1}'
+        assert self.app.json.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_orjson_provider_matches_default_provider(self):
+        pytest.importorskip("orjson")
+        default = DefaultJSONProvider(self.app)
+        obj = {"when": datetime(2026, 3, 15, 10, 30), "day": date(2026, 3, 15), "by_id": {2: "b"}}
+        assert self.app.json.dumps(obj) == default.dumps(obj, separators=(",", ":"))
+        assert self.app.json.dumps(obj, indent=2) == default.dumps(obj, indent=2)
+
+    def test_health_reports_config_presence(self, monkeypatch):
+        ok = self.client.get("/health")
+        monkeypatch.setattr("jira_roadmap.web.routes.config_exists", lambda: False)
+        missing = self.client.get("/health")
+        assert (ok.status_code, ok.json) == (200, {"status": "ok", "config_loaded": True})
+        assert missing.status_code == 503
+        assert missing.json["config_loaded"] is False
 
     def test_get_index_renders(self):
-        with patch("jira_roadmap.web.routes.config_exists", return_value=True):
-            resp = self.client.get("/")
+        resp = self.client.get("/")
         assert resp.status_code == 200
         assert b"Roadmap" in resp.data or b"roadmap" in resp.data
 
     def test_post_requires_jql(self):
-        with patch("jira_roadmap.web.routes.config_exists", return_value=True):
-            resp = self.client.post("/", data={"jql": ""})
+        resp = self.client.post("/", data={"jql": ""})
         assert resp.status_code == 400
 
-    @patch("jira_roadmap.web.routes.fetch_roadmap")
-    @patch("jira_roadmap.web.routes.roadmap_result_to_dict")
-    @patch("jira_roadmap.web.routes.config_exists", return_value=True)
-    def test_post_success(self, mock_exists, mock_to_dict, mock_fetch):
-        mock_result = MagicMock()
-        mock_result.initiatives = []
-        mock_fetch.return_value = mock_result
-        mock_to_dict.return_value = {
+    def test_post_rejects_oversized_jql(self, mock_fetch):
+        resp = self.client.post("/", data={"jql": "key = A-1 OR " * 500})
+        assert resp.status_code == 400
+        assert b"too long" in resp.data
+        mock_fetch.assert_not_called()
+
+    def test_post_success(self, mock_to_json, mock_fetch):
+        mock_to_json.return_value = json.dumps({
             "initiatives": [],
             "timeline_start": "2026-01-01",
             "timeline_end": "2026-12-31",
             "jql_query": "test",
             "jira_url": "https://jira.example.com",
-        }
+        }).encode()
 
         resp = self.client.post("/", data={"jql": "type = Initiative"})
         assert resp.status_code == 200
+        job = self._wait_for_job(resp)
+        assert job.status_code == 200
+        assert job.json["status"] == "done"
+        assert job.json["result"]["timeline_start"] == "2026-01-01"
+
+    def test_post_job_reports_roadmap_errors(self, mock_fetch):
+        mock_fetch.side_effect = InvalidJqlError("Invalid JQL query: nope")
+
+        job = self._wait_for_job(self.client.post("/", data={"jql": "nope"}))
+        assert job.status_code == 400
+        assert job.json == {"status": "error", "error": "Invalid JQL query: nope"}
+
+    def test_post_job_reports_empty_roadmap_as_warning(self, mock_fetch):
+        mock_fetch.side_effect = NoIssuesFoundError("No issues found matching your query.")
+
+        job = self._wait_for_job(self.client.post("/", data={"jql": "type = Initiative"}))
+        assert job.status_code == 200
+        assert job.json["status"] == "warning"
+
+    def test_concurrent_posts_share_one_job(self, mock_to_json, mock_fetch):
+        release = threading.Event()
+        result = SimpleNamespace(initiatives=[])
+        mock_fetch.side_effect = lambda *args, **kwargs: release.wait(5) and result
+
+        first = self.client.post("/", data={"jql": "type = Initiative"})
+        second = self.client.post("/", data={"jql": "type = Initiative"})
+        release.set()
+
+        assert self._job_id(first) == self._job_id(second)
+        assert self._wait_for_job(first).json["status"] == "done"
+        assert mock_fetch.call_count == 1
+
+    def test_refresh_does_not_join_running_job(self, mock_to_json, mock_fetch):
+        release = threading.Event()
+        result = SimpleNamespace(initiatives=[])
+        mock_fetch.side_effect = lambda *args, **kwargs: release.wait(5) and result
+
+        first = self.client.post("/", data={"jql": "type = Initiative"})
+        refreshed = self.client.post("/?refresh=1", data={"jql": "type = Initiative"})
+        release.set()
+
+        assert self._job_id(first) != self._job_id(refreshed)
+        self._wait_for_job(first)
+        self._wait_for_job(refreshed)
+        assert [c.kwargs["use_cache"] for c in mock_fetch.call_args_list] == [True, False]
+
+    def test_simultaneous_posts_submit_one_job(self, mock_to_json, mock_fetch):
+        release = threading.Event()
+        result = SimpleNamespace(initiatives=[])
+        mock_fetch.side_effect = lambda *args, **kwargs: release.wait(5) and result
+        barrier = threading.Barrier(4)
+        responses = []
+
+        def post():
+            with self.app.test_client() as client:
+                barrier.wait()
+                responses.append(client.post("/", data={"jql": "type = Initiative"}))
+
+        threads = [threading.Thread(target=post) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        release.set()
+
+        assert len({self._job_id(resp) for resp in responses}) == 1
+        self._wait_for_job(responses[0])
+        assert mock_fetch.call_count == 1
+
+    def test_post_forwards_batch_size(self, mock_to_json, mock_fetch):
+        self._wait_for_job(
+            self.client.post("/", data={"jql": "type = Initiative", "batch_size": "100"})
+        )
+        assert mock_fetch.call_args.kwargs["batch_size"] == 100
+
+    @pytest.mark.parametrize("batch_size", ["10", "5000", "lots"])
+    def test_post_rejects_out_of_range_batch_size(self, batch_size):
+        resp = self.client.post("/", data={"jql": "type = Initiative", "batch_size": batch_size})
+        assert resp.status_code == 400
+        assert b"Batch size" in resp.data
 
-    @patch("jira_roadmap.web.routes.config_exists", return_value=False)
-    def test_api_link_types_no_config(self, mock_exists):
+    def test_rate_limited_job_forwards_retry_after(self, mock_fetch):
+        mock_fetch.side_effect = JiraRateLimitError("slow down", retry_after=2.5)
+
+        job = self._wait_for_job(self.client.post("/", data={"jql": "type = Initiative"}))
+        assert job.status_code == 429
+        assert job.headers["Retry-After"] == "3"
+
+    def test_api_link_types_forwards_retry_after(self, jira_client):
+        jira_client.list_link_types.side_effect = RateLimitError("slow down", retry_after=10)
+
+        resp = self.client.get("/api/link-types")
+        assert resp.status_code == 429
+        assert resp.headers["Retry-After"] == "10"
+
+    def test_unknown_job_is_not_found(self):
+        assert self.client.get("/api/roadmap/missing").status_code == 404
+
+    @pytest.mark.noconfig
+    def test_post_without_config_shows_setup(self, monkeypatch):
+        monkeypatch.setattr("jira_roadmap.web.routes.config_exists", lambda: False)
+        resp = self.client.post("/", data={"jql": "type = Initiative"})
+        assert resp.status_code == 503
+        assert b"Setup Required" in resp.data
+
+    def test_post_escapes_embedded_json(self, mock_to_json, mock_fetch):
+        mock_to_json.return_value = b'{"title": "</script><b>x</b>"}'
+
+        self._wait_for_job(self.client.post("/", data={"jql": "type = Initiative"}))
+        resp = self.client.post("/", data={"jql": "type = Initiative"})
+        assert b"</script><b>" not in resp.data
+        assert b"\\u003c/script\\u003e" in resp.data
+
+    @pytest.mark.parametrize("field,value", [
+        ("jira_url", "https://other.example.com"),
+        ("jira_email", "you@example.com"),
+        ("start_date_field", "cf_20000"),
+        ("end_date_field", "cf_20001"),
+    ])
+    def test_cached_roadmap_is_scoped_to_config(
+        self, mock_to_json, mock_fetch, monkeypatch, roadmap_config, field, value
+    ):
+        self._wait_for_job(self.client.post("/", data={"jql": "type = Initiative"}))
+
+        changed = SimpleNamespace(**{**vars(roadmap_config), field: value})
+        monkeypatch.setattr("jira_roadmap.web.routes.load_config", lambda: changed)
+        resp = self.client.post("/", data={"jql": "type = Initiative"})
+        assert b"/api/roadmap/" in resp.data
+        self._wait_for_job(resp)
+        assert mock_fetch.call_count == 2
+
+    def test_invalid_config_skips_roadmap_cache(self, mock_to_json, mock_fetch, monkeypatch):
+        def load_config():
+            raise ValueError("bad config")
+
+        monkeypatch.setattr("jira_roadmap.web.routes.load_config", load_config)
+        for _ in range(2):
+            self._wait_for_job(self.client.post("/", data={"jql": "type = Initiative"}))
+        assert mock_fetch.call_count == 2
+
+    def test_demo_page_is_rendered_once_per_day(self, monkeypatch):
+        first = self.client.get("/demo")
+        assert first.status_code == 200
+        mock_render = MagicMock()
+        monkeypatch.setattr("jira_roadmap.web.routes.render_template", mock_render)
+        second = self.client.get("/demo")
+        mock_render.assert_not_called()
+        assert second.data == first.data
+
+    def test_demo_can_be_disabled(self, monkeypatch):
+        monkeypatch.setitem(self.app.config, "DEMO_ENABLED", False)
+        assert self.client.get("/demo").status_code == 404
+
+    @pytest.mark.noconfig
+    def test_api_link_types_no_config(self, monkeypatch):
+        monkeypatch.setattr("jira_roadmap.web.routes.config_exists", lambda: False)
         resp = self.client.get("/api/link-types")
         assert resp.status_code == 503
+
+    def test_api_link_types_caches_successes_only(self, jira_client):
+        jira_client.list_link_types.side_effect = [AuthenticationError("bad token"), ["Blocks"]]
+
+        assert self.client.get("/api/link-types").status_code == 401
+        assert self.client.get("/api/link-types").json == ["Blocks"]
+        assert self.client.get("/api/link-types").json == ["Blocks"]
+        assert jira_client.list_link_types.call_count == 2
+
+    def test_post_reuses_cached_roadmap(self, mock_to_json, mock_fetch):
+
+        self._wait_for_job(
+            self.client.post("/", data={"jql": "type = Initiative", "link_types": "B, A"})
+        )
+        resp = self.client.post("/", data={"jql": "type = Initiative", "link_types": "A,B"})
+        assert b"/api/roadmap/" not in resp.data
+        assert mock_fetch.call_count == 1
+        assert mock_fetch.call_args.kwargs["use_cache"] is True
+        assert mock_to_json.call_count == 1
+
+        self._wait_for_job(
+            self.client.post("/?refresh=1", data={"jql": "type = Initiative", "link_types": "A,B"})
+        )
+        assert mock_fetch.call_count == 2
+        assert mock_fetch.call_args.kwargs["use_cache"] is False
@@ -0,0 +1,25 @@
+"""Tests for the web layer's in-memory TTL cache."""
+
+from unittest.mock import patch
+
+from jira_roadmap.web.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_returns_value_until_expired(self):
+        cache = TTLCache(maxsize=2, ttl=10)
+        with patch("jira_roadmap.web.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            assert cache.get("a") == 1
+        with patch("jira_roadmap.web.cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+
+    def test_evicts_oldest_when_full(self):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert (cache.get("b"), cache.get("c")) == (2, 3)
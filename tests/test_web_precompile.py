@@ -0,0 +1,28 @@
+"""Tests for precompiled web templates."""
+
+from unittest.mock import patch
+
+from jira_roadmap.web.app import create_app
+from jira_roadmap.web.precompile import compile_templates
+
+
+class TestPrecompiledTemplates:
+    """Tests for compiling templates and loading them in the app."""
+
+    def test_app_renders_from_compiled_templates(self, tmp_path, monkeypatch):
+        compile_templates(tmp_path)
+        assert list(tmp_path.glob("tmpl_*.py"))
+
+        monkeypatch.setenv("JIRA_ROADMAP_COMPILED_TEMPLATES", str(tmp_path))
+        app = create_app()
+        assert app.jinja_env.get_template("index.html").filename.startswith(str(tmp_path))
+
+        with patch("jira_roadmap.web.routes.config_exists", return_value=True):
+            resp = app.test_client().get("/")
+        assert resp.status_code == 200
+        assert b"roadmap-form" in resp.data
+
+    def test_app_uses_source_templates_by_default(self, monkeypatch):
+        monkeypatch.delenv("JIRA_ROADMAP_COMPILED_TEMPLATES", raising=False)
+        app = create_app()
+        assert app.jinja_env.get_template("index.html").filename.endswith("index.html")